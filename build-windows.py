@@ -7,17 +7,37 @@ Usage with uv:
 Usage with pip (activate venv first):
     pip install -r requirements-dev.txt
     python build-windows.py build
+
+Append --upx to compress the built executables and DLLs with UPX
+(skipped if upx is not on PATH).
 """
 
+import os
+import shutil
+import subprocess
 import sys
 import warnings
 from pathlib import Path
 
-import tomlkit
 from cx_Freeze import Executable, setup
 from cx_Freeze.finder import ModuleFinder
 
 
+def _read_version_from_pyproject(pyproject_path: Path) -> str:
+    # Only project.version is needed, so scan lines instead of parsing the TOML
+    in_project = False
+    with pyproject_path.open(encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("["):
+                in_project = line == "[project]"
+            elif in_project and line.startswith("version") and "=" in line:
+                key, value = line.split("=", 1)
+                if key.strip() == "version":
+                    return value.strip().strip('"')
+    raise RuntimeError(f"No [project] version found in {pyproject_path}")
+
+
 # Prefer version.txt (bump_version writes full metadata); fallback to pyproject
 def load_version() -> str:
     version_txt = Path(__file__).parent / "resources" / "version.txt"
@@ -27,10 +47,7 @@ def load_version() -> str:
                 version_str = line.split("=", 1)[1].strip()
                 # Strip trailing .0 for semantic versioning (0.5.0.0 -> 0.5.0)
                 return version_str.rstrip("0").rstrip(".")
-    pyproject_path = Path(__file__).parent / "pyproject.toml"
-    pyproject_content = pyproject_path.read_text(encoding="utf-8")
-    pyproject_data = tomlkit.parse(pyproject_content)
-    return pyproject_data["project"]["version"]  # type: ignore[index]
+    return _read_version_from_pyproject(Path(__file__).parent / "pyproject.toml")
 
 
 VERSION = load_version()
@@ -40,6 +57,11 @@ warnings.filterwarnings("ignore", category=SyntaxWarning)
 if sys.platform != "win32":
     sys.exit("This script must be run on Windows to build a Windows binary.")
 
+# Our own flag; strip it before cx_Freeze parses the command line
+USE_UPX = "--upx" in sys.argv
+if USE_UPX:
+    sys.argv.remove("--upx")
+
 # Include necessary files without including source code
 include_files = [
     ("src/resources/", "resources/"),
@@ -50,6 +72,42 @@ include_files = [
 # Explicitly include UI submodules for cx_Freeze
 ui_packages = []
 
+# Pillow image plugins never used by the app (it only reads PNG/JPEG/ICO
+# resources and screenshots), kept out of library.zip
+unused_pil_plugins = [
+    "PIL.BufrStubImagePlugin",
+    "PIL.DdsImagePlugin",
+    "PIL.FliImagePlugin",
+    "PIL.FpxImagePlugin",
+    "PIL.GribStubImagePlugin",
+    "PIL.Hdf5StubImagePlugin",
+    "PIL.ImImagePlugin",
+    "PIL.IptcImagePlugin",
+    "PIL.McIdasImagePlugin",
+    "PIL.MicImagePlugin",
+    "PIL.MpegImagePlugin",
+    "PIL.PcxImagePlugin",
+    "PIL.PixarImagePlugin",
+    "PIL.PsdImagePlugin",
+    "PIL.SgiImagePlugin",
+    "PIL.SunImagePlugin",
+    "PIL.TgaImagePlugin",
+    "PIL.WmfImagePlugin",
+    "PIL.XVThumbImagePlugin",
+    "PIL.XbmImagePlugin",
+    "PIL.XpmImagePlugin",
+]
+
+# er_save_manager is imported from library.zip, so its non-Python data files
+# must be stored inside the zip as well (listed per file for cx_Freeze)
+package_data_files = [
+    (str(path), path.relative_to("src").as_posix())
+    for path in [
+        *Path("src/er_save_manager/data/items").rglob("*.txt"),
+        Path("src/er_save_manager/fixes/CSNetMan.bin"),
+    ]
+]
+
 # Add additional options like packages and excludes
 build_exe_options = {
     # Explicitly include the entire package to handle relative imports
@@ -57,12 +115,14 @@ build_exe_options = {
     # Include all modules explicitly
     "includes": [],
     "include_files": include_files,
-    # Compress packages into library.zip to reduce file count (bloat)
+    # Compress packages into library.zip to reduce file count and startup I/O
     # Exclude specific packages that rely on __file__ for resource loading
-    "zip_exclude_packages": ["er_save_manager", "customtkinter", "customtkinterthemes"],
+    "zip_exclude_packages": ["customtkinter", "customtkinterthemes"],
     "zip_include_packages": ["*"],
+    # Package data read through importlib.resources, stored next to the modules
+    "zip_includes": package_data_files,
     # Exclude unused heavy dependencies found in environment
-    "excludes": ["unittest", "pydoc"],
+    "excludes": ["unittest", "pydoc"] + unused_pil_plugins,
     # Output dir for built executables and dependencies
     "build_exe": f"dist/windows-{VERSION}/er-save-manager_{VERSION}",
     # Optimize .pyc files (2 strips docstrings)
@@ -90,11 +150,50 @@ executables = [
 ]
 
 
-# Monkey patch to exclude tzdata and demos from tcl/tk (reduces build size significantly)
+# Monkey patch to exclude unused tcl/tk data (reduces build size significantly)
+
+# Folders never needed at runtime: timezones, demos, message catalogs for Tk's
+# built-in dialogs (Windows uses native ones) and Tcl's test/http packages
+TCLTK_SKIP_DIRS = {"tzdata", "demos", "msgs", "tcltest", "http1.0", "opt0.4"}
+# utf-8 is built into Tcl; keep Latin-1 plus the common Windows ANSI code pages
+# so Tcl can still resolve the system encoding on non-Western locales
+TCLTK_KEEP_ENCODINGS = {
+    "ascii.enc",
+    "iso8859-1.enc",
+    "cp1250.enc",
+    "cp1251.enc",
+    "cp1252.enc",
+    "cp1253.enc",
+    "cp1254.enc",
+    "cp932.enc",
+    "cp936.enc",
+    "cp949.enc",
+    "cp950.enc",
+}
 
 original_include_files = ModuleFinder.include_files
 
 
+def iter_tcltk_files(directory: str, rel_parts: tuple[str, ...] = ()):
+    """Yield (path, relative parts) for tcl/tk files worth shipping.
+
+    Skipped folders are pruned before being entered, and os.scandir reuses the
+    directory listing's file type instead of stat'ing every entry.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if entry.name not in TCLTK_SKIP_DIRS:
+                    yield from iter_tcltk_files(entry.path, (*rel_parts, entry.name))
+                continue
+            if (
+                rel_parts[:1] == ("encoding",)
+                and entry.name not in TCLTK_KEEP_ENCODINGS
+            ):
+                continue
+            yield entry.path, (*rel_parts, entry.name)
+
+
 def patched_include_files(self, source_path, target_path, copy_dependent_files=True):
     source_path = Path(source_path)
     target_path = Path(target_path)
@@ -103,19 +202,10 @@ def patched_include_files(self, source_path, target_path, copy_dependent_files=T
     if str(target_path).startswith("share") and source_path.is_dir():
         if "tcl" in source_path.name or "tk" in source_path.name:
             # Manually walk and include files, skipping bloat
-            for file_path in source_path.rglob("*"):
-                if file_path.is_dir():
-                    continue
-
-                # Check for excluded folders
-                rel_path = file_path.relative_to(source_path)
-                if "tzdata" in rel_path.parts or "demos" in rel_path.parts:
-                    continue  # Skip these bulky folders
-
-                # Include this specific file
-                final_target = target_path / rel_path
+            for file_path, rel_parts in iter_tcltk_files(str(source_path)):
+                final_target = target_path.joinpath(*rel_parts)
                 original_include_files(
-                    self, file_path, final_target, copy_dependent_files
+                    self, Path(file_path), final_target, copy_dependent_files
                 )
             return
 
@@ -133,3 +223,26 @@ setup(
     options={"build_exe": build_exe_options},
     executables=executables,
 )
+
+
+# Binaries UPX breaks: CFG-protected CPython/MSVC runtime DLLs and API sets
+UPX_SKIP_PREFIXES = ("python3", "vcruntime", "msvcp", "ucrtbase", "api-ms-win-")
+
+
+def compress_with_upx(build_dir: Path) -> None:
+    upx = shutil.which("upx")
+    if upx is None:
+        print("upx not found on PATH, skipping compression")
+        return
+
+    for path in build_dir.rglob("*"):
+        if path.suffix.lower() not in (".exe", ".dll"):
+            continue
+        if path.name.lower().startswith(UPX_SKIP_PREFIXES):
+            continue
+        subprocess.run([upx, "--best", "--lzma", "-q", str(path)], check=False)
+
+
+build_dir = Path(build_exe_options["build_exe"])
+if USE_UPX and build_dir.is_dir():
+    compress_with_upx(build_dir)
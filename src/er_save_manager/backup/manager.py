@@ -85,11 +85,24 @@ class BackupManager:
             self.save_path.name + self.BACKUP_FOLDER_SUFFIX
         )
         self._history: BackupHistory | None = None
+        self._history_mtime: int | None = None
+
+    def _metadata_mtime(self) -> int | None:
+        try:
+            return (self.backup_folder / self.METADATA_FILE).stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh_history(self) -> None:
+        """Drop the loaded history if metadata.json changed since it was read."""
+        if self._history is not None and self._metadata_mtime() != self._history_mtime:
+            self._history = None
 
     @property
     def history(self) -> BackupHistory:
         """Get backup history, loading from disk if needed."""
         if self._history is None:
+            self._history_mtime = self._metadata_mtime()
             self._history = self._load_history()
         return self._history
 
@@ -111,6 +124,7 @@ class BackupManager:
         metadata_path = self.backup_folder / self.METADATA_FILE
         with open(metadata_path, "w") as f:
             json.dump(self.history.to_dict(), f, indent=2)
+        self._history_mtime = self._metadata_mtime()
 
     def _sanitize_filename_part(self, text: str) -> str:
         """Sanitize a string for safe use in filenames."""
@@ -181,6 +195,7 @@ class BackupManager:
         Returns:
             Tuple of (Path to created backup, List of BackupMetadata that will be pruned)
         """
+        self._refresh_history()
         self.backup_folder.mkdir(parents=True, exist_ok=True)
 
         # Check compression setting
@@ -296,6 +311,7 @@ class BackupManager:
         Returns:
             List of BackupMetadata sorted by timestamp (newest first)
         """
+        self._refresh_history()
         return self.history.backups
 
     def restore_backup(self, backup_name: str) -> bool:
@@ -394,6 +410,7 @@ class BackupManager:
         Returns:
             True if successful
         """
+        self._refresh_history()
         backup_path = self.backup_folder / backup_name
         if backup_path.exists():
             backup_path.unlink()
@@ -415,6 +432,7 @@ class BackupManager:
         Returns:
             List of BackupMetadata that would be deleted
         """
+        self._refresh_history()
         if len(self.history.backups) <= keep_count:
             return []
 
@@ -430,6 +448,7 @@ class BackupManager:
         Returns:
             Number of backups deleted
         """
+        self._refresh_history()
         if len(self.history.backups) <= keep_count:
             return 0
 
@@ -500,6 +519,7 @@ class BackupManager:
         Returns:
             BackupMetadata or None if not found
         """
+        self._refresh_history()
         for backup in self.history.backups:
             if backup.filename == backup_name:
                 return backup
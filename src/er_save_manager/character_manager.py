@@ -4,6 +4,7 @@ import json
 import os
 import platform
 import ssl
+import sys
 import tempfile
 import urllib.request
 from datetime import datetime, timedelta
@@ -31,8 +32,12 @@ class CharacterManager:
                     Path.home() / ".cache" / "er-save-manager" / "characters"
                 )
         else:
-            # Windows/macOS: use program directory
-            program_dir = Path(__file__).parent.parent.parent
+            # Windows/macOS: use program directory (next to the frozen exe, whose
+            # modules live inside library.zip)
+            if getattr(sys, "frozen", False):
+                program_dir = Path(sys.executable).parent
+            else:
+                program_dir = Path(__file__).parent.parent.parent
             self.cache_dir = program_dir / "data" / "characters"
 
         # Try to create cache directory, fallback to temp if permission denied
@@ -7,10 +7,13 @@ Convergence saves (.cnv and .cnv.co2 formats).
 
 from __future__ import annotations
 
+from importlib import resources
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from importlib.resources.abc import Traversable
+
     from er_save_manager.parser.save import Save
 
 
@@ -18,10 +21,10 @@ if TYPE_CHECKING:
 _CONVERGENCE_ITEMS_CACHE: dict[str, dict[str, int]] = {}
 
 
-def _get_bundled_hex_dir() -> Path:
+def _get_bundled_hex_dir() -> Traversable:
     """Get path to bundled Convergence HEX ID files."""
-    # Get the data directory where this module is located
-    data_dir = Path(__file__).parent
+    # importlib.resources keeps this working when frozen into library.zip
+    data_dir = resources.files("er_save_manager.data")
     hex_dir = data_dir / "items" / "Convergence"
     return hex_dir
 
@@ -41,11 +44,12 @@ def parse_convergence_hex_files(
     """
     if hex_dir is None:
         hex_dir = _get_bundled_hex_dir()
+    elif isinstance(hex_dir, str):
+        hex_dir = Path(hex_dir)
 
     items_by_category: dict[str, dict[str, int]] = {}
-    hex_dir = Path(hex_dir)
 
-    if not hex_dir.exists():
+    if not hex_dir.is_dir():
         return {}
 
     item_files = [
@@ -63,12 +67,12 @@ def parse_convergence_hex_files(
     ]
 
     for category, item_file in item_files:
-        if not item_file.exists():
+        if not item_file.is_file():
             continue
 
         items: dict[str, int] = {}
         try:
-            with open(item_file, encoding="utf-8") as file:
+            with item_file.open(encoding="utf-8") as file:
                 for line in file:
                     line = line.strip()
                     if not line or line.startswith("//"):
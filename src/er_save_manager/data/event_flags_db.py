@@ -4,6 +4,8 @@ Combined from Cheat Engine script (Dasaav/Umgak) and community documentation
 Total flags: 1295
 """
 
+from functools import lru_cache
+
 EVENT_FLAGS = {
     20: {
         "name": "Playthrough Complete: Age of Fracture",
@@ -8081,32 +8083,71 @@ FLAGS_BY_CATEGORY = {
 
 CATEGORIES = list(FLAGS_BY_CATEGORY.keys())
 
+# Category lookups precomputed once: every flag in a category (sorted), and the
+# flags of each named subcategory
+CATEGORY_TO_IDS: dict[str, tuple[int, ...]] = {
+    category: tuple(sorted(flag for flags in subcats.values() for flag in flags))
+    for category, subcats in FLAGS_BY_CATEGORY.items()
+}
+CATEGORY_SUBCAT_TO_IDS: dict[tuple[str, str], tuple[int, ...]] = {
+    (category, subcategory): tuple(flags)
+    for category, subcats in FLAGS_BY_CATEGORY.items()
+    for subcategory, flags in subcats.items()
+    if subcategory is not None
+}
+
 
 def get_flag_info(flag_id: int) -> dict | None:
     """Get information about a flag"""
     return EVENT_FLAGS.get(flag_id)
 
 
+# The database is static, so lookups are cached; callers must not mutate results
+@lru_cache(maxsize=2048)
 def get_flag_name(flag_id: int) -> str:
     """Get flag name or return ID as string"""
     info = EVENT_FLAGS.get(flag_id)
     return info["name"] if info else f"Flag {flag_id}"
 
 
-def get_category_flags(category: str, subcategory: str = None) -> list[int]:
+def get_category_flags(category: str, subcategory: str = None) -> tuple[int, ...]:
     """Get all flags in a category/subcategory"""
-    if category not in FLAGS_BY_CATEGORY:
-        return []
     if subcategory is not None:
-        return FLAGS_BY_CATEGORY[category].get(subcategory, [])
-    all_flags = []
-    for subcat_flags in FLAGS_BY_CATEGORY[category].values():
-        all_flags.extend(subcat_flags)
-    return sorted(all_flags)
+        return CATEGORY_SUBCAT_TO_IDS.get((category, subcategory), ())
+    return CATEGORY_TO_IDS.get(category, ())
 
 
-def get_subcategories(category: str) -> list[str]:
+@lru_cache(maxsize=128)
+def get_subcategories(category: str) -> tuple[str, ...]:
     """Get all subcategories for a category"""
     if category not in FLAGS_BY_CATEGORY:
-        return []
-    return sorted([k for k in FLAGS_BY_CATEGORY[category].keys() if k is not None])
+        return ()
+    return tuple(sorted(k for k in FLAGS_BY_CATEGORY[category] if k is not None))
+
+
+# (haystack, flag_id, name, category, subcategory), built on first search
+_search_index: list[tuple[str, int, str, str, str | None]] | None = None
+
+
+def _build_search_index() -> list[tuple[str, int, str, str, str | None]]:
+    entries = []
+    for category in CATEGORIES:
+        for subcategory in get_subcategories(category) or (None,):
+            for flag_id in get_category_flags(category, subcategory):
+                name = get_flag_name(flag_id)
+                # NUL keeps a query from matching across the ID/name boundary
+                haystack = f"{flag_id}\0{name.lower()}"
+                entries.append((haystack, flag_id, name, category, subcategory))
+    return entries
+
+
+def search_flags(query: str) -> list[tuple[int, str, str, str | None]]:
+    """Find flags whose ID or name contains query (case-insensitive).
+
+    Returns (flag_id, name, category, subcategory) tuples in category order.
+    """
+    global _search_index
+    if _search_index is None:
+        _search_index = _build_search_index()
+    query = query.lower()
+    return [entry[1:] for entry in _search_index if query in entry[0]]
@@ -5,7 +5,8 @@ Loads and provides access to all items organized by category
 
 from dataclasses import dataclass
 from enum import IntEnum
-from pathlib import Path
+from importlib import resources
+from importlib.resources.abc import Traversable
 
 
 class ItemCategory(IntEnum):
@@ -51,16 +52,17 @@ class ItemDatabase:
         if self._loaded:
             return
 
-        base_path = Path(__file__).parent / "items"
+        # importlib.resources keeps this working when frozen into library.zip
+        base_path = resources.files("er_save_manager.data") / "items"
         categories_file = base_path / "ItemCategories.txt"
 
-        if not categories_file.exists():
+        if not categories_file.is_file():
             raise FileNotFoundError(
                 f"ItemCategories.txt not found at {categories_file}"
             )
 
         # Parse category definitions
-        with open(categories_file, encoding="utf-8-sig") as f:
+        with categories_file.open(encoding="utf-8-sig") as f:
             for line in f:
                 line = line.strip()
 
@@ -82,15 +84,17 @@ class ItemDatabase:
 
                 # Load items from the specified file
                 item_file = base_path / rel_path
-                if item_file.exists():
+                if item_file.is_file():
                     self._load_items_from_file(item_file, category, category_name)
                     self.categories.append((category_name, ItemCategory(category)))
 
         self._loaded = True
 
-    def _load_items_from_file(self, filepath: Path, category: int, category_name: str):
+    def _load_items_from_file(
+        self, filepath: Traversable, category: int, category_name: str
+    ):
         """Load items from a single file"""
-        with open(filepath, encoding="utf-8-sig") as f:
+        with filepath.open(encoding="utf-8-sig") as f:
             for line in f:
                 line = line.strip()
 
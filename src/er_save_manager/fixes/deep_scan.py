@@ -31,7 +31,7 @@ from __future__ import annotations
 import logging
 import struct
 from dataclasses import dataclass, field
-from pathlib import Path
+from importlib import resources
 from typing import TYPE_CHECKING
 
 from .base import BaseFix, FixResult
@@ -1085,7 +1085,7 @@ def _load_clean_netman() -> bytes | None:
     The file is expected to live alongside this module. Returns None if not found
     or if the size does not match _NETMAN_SIZE.
     """
-    candidate = Path(__file__).parent / "CSNetMan.bin"
+    candidate = resources.files(__package__) / "CSNetMan.bin"
     if not candidate.is_file():
         log.debug("[deep_scan] CSNetMan.bin not found at %s", candidate)
         return None
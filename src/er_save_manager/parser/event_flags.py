@@ -11,6 +11,7 @@ Includes corruption detection and fixes for:
 
 import os
 import sys
+from collections.abc import Iterable
 from pathlib import Path
 
 
@@ -103,23 +104,17 @@ class EventFlags:
         return cls._bst_map
 
     @classmethod
-    def get_flag(cls, event_flags: bytes, event_id: int) -> bool:
+    def _flag_position(cls, event_id: int, size: int) -> tuple[int, int]:
         """
-        Get the state of an event flag.
+        Locate an event flag in the event_flags array.
 
         Args:
-            event_flags: The event_flags byte array from a character slot
-            event_id: The event flag ID to check
+            event_id: The event flag ID
+            size: Length of the event_flags array
 
         Returns:
-            True if the flag is set, False otherwise
+            (byte position, bit mask) of the flag
         """
-        if len(event_flags) != cls.EVENT_FLAGS_SIZE:
-            raise ValueError(
-                f"event_flags must be {cls.EVENT_FLAGS_SIZE} bytes, "
-                f"got {len(event_flags)}"
-            )
-
         bst_map = cls._load_bst_map()
 
         block = event_id // cls.FLAG_DIVISOR
@@ -134,60 +129,112 @@ class EventFlags:
         bit_index = 7 - bit_index
 
         byte_pos = offset + byte_index
-        if byte_pos >= len(event_flags):
+        if byte_pos >= size:
             raise ValueError(
                 f"Calculated byte position {byte_pos} exceeds event_flags size"
             )
 
-        event_byte = event_flags[byte_pos]
-        return ((event_byte >> bit_index) & 1) == 1
+        return byte_pos, 1 << bit_index
 
     @classmethod
-    def set_flag(cls, event_flags: bytearray, event_id: int, state: bool) -> None:
+    def get_flag(cls, event_flags: bytes, event_id: int) -> bool:
         """
-        Set the state of an event flag.
+        Get the state of an event flag.
 
         Args:
-            event_flags: The event_flags byte array from a character slot (mutable)
-            event_id: The event flag ID to set
-            state: True to set the flag, False to clear it
+            event_flags: The event_flags byte array from a character slot
+            event_id: The event flag ID to check
+
+        Returns:
+            True if the flag is set, False otherwise
         """
-        if not isinstance(event_flags, bytearray):
-            raise TypeError("event_flags must be a bytearray for modification")
+        if len(event_flags) != cls.EVENT_FLAGS_SIZE:
+            raise ValueError(
+                f"event_flags must be {cls.EVENT_FLAGS_SIZE} bytes, "
+                f"got {len(event_flags)}"
+            )
+
+        byte_pos, mask = cls._flag_position(event_id, len(event_flags))
+        return (event_flags[byte_pos] & mask) != 0
+
+    @classmethod
+    def get_flags_bulk(cls, event_flags: bytes, event_ids: Iterable[int]) -> list[bool]:
+        """
+        Get the states of many event flags at once.
+
+        Args:
+            event_flags: The event_flags byte array from a character slot
+            event_ids: The event flag IDs to check
 
+        Returns:
+            Flag states in the same order as event_ids
+        """
         if len(event_flags) != cls.EVENT_FLAGS_SIZE:
             raise ValueError(
                 f"event_flags must be {cls.EVENT_FLAGS_SIZE} bytes, "
                 f"got {len(event_flags)}"
             )
 
-        bst_map = cls._load_bst_map()
+        size = len(event_flags)
+        states = []
+        for event_id in event_ids:
+            byte_pos, mask = cls._flag_position(event_id, size)
+            states.append((event_flags[byte_pos] & mask) != 0)
+        return states
 
-        block = event_id // cls.FLAG_DIVISOR
-        index = event_id - block * cls.FLAG_DIVISOR
+    @classmethod
+    def set_flag(cls, event_flags: bytearray, event_id: int, state: bool) -> None:
+        """
+        Set the state of an event flag.
 
-        if block not in bst_map:
-            raise ValueError(f"Event ID {event_id} (block {block}) not found in BST")
+        Args:
+            event_flags: The event_flags byte array from a character slot (mutable)
+            event_id: The event flag ID to set
+            state: True to set the flag, False to clear it
+        """
+        cls.set_flags_bulk(event_flags, [(event_id, state)])
 
-        offset = bst_map[block] * cls.BLOCK_SIZE
-        byte_index = index // 8
-        bit_index = index - byte_index * 8
-        bit_index = 7 - bit_index
+    @classmethod
+    def set_flags_bulk(
+        cls, event_flags: bytearray, changes: Iterable[tuple[int, bool]]
+    ) -> int:
+        """
+        Set the state of many event flags at once.
 
-        byte_pos = offset + byte_index
-        if byte_pos >= len(event_flags):
+        Every ID is resolved before anything is written, so an unknown ID
+        leaves event_flags untouched. Flags already in the requested state
+        are skipped.
+
+        Args:
+            event_flags: The event_flags byte array from a character slot (mutable)
+            changes: (event_id, state) pairs
+
+        Returns:
+            Number of flags whose state actually changed
+        """
+        if not isinstance(event_flags, bytearray):
+            raise TypeError("event_flags must be a bytearray for modification")
+
+        if len(event_flags) != cls.EVENT_FLAGS_SIZE:
             raise ValueError(
-                f"Calculated byte position {byte_pos} exceeds event_flags size"
+                f"event_flags must be {cls.EVENT_FLAGS_SIZE} bytes, "
+                f"got {len(event_flags)}"
             )
 
-        event_byte = event_flags[byte_pos]
+        size = len(event_flags)
+        positions = [
+            (*cls._flag_position(event_id, size), state) for event_id, state in changes
+        ]
 
-        if state:
-            event_byte |= 1 << bit_index
-        else:
-            event_byte &= ~(1 << bit_index)
+        changed = 0
+        for byte_pos, mask, state in positions:
+            event_byte = event_flags[byte_pos]
+            new_byte = event_byte | mask if state else event_byte & ~mask
+            if new_byte != event_byte:
+                event_flags[byte_pos] = new_byte
+                changed += 1
 
-        event_flags[byte_pos] = event_byte
+        return changed
 
 
 class FixFlags:
@@ -7,6 +7,7 @@ Based on ER-Save-Lib Rust implementation.
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from io import BytesIO
 
@@ -250,7 +251,6 @@ class Save:
 
         import hashlib
 
-        SLOT_SIZE = 0x280000
         CHECKSUM_SIZE = 0x10
 
         # Recalculate for each active slot using tracked offsets
@@ -259,17 +259,7 @@ class Save:
             if slot.is_empty():
                 continue
 
-            # Use tracked offset for this slot
-            slot_offset = self._slot_offsets[slot_idx]
-            checksum_offset = slot_offset
-            data_offset = slot_offset + CHECKSUM_SIZE
-
-            # Calculate MD5 of character data
-            char_data = self._raw_data[data_offset : data_offset + SLOT_SIZE]
-            md5_hash = hashlib.md5(char_data).digest()
-
-            # Write checksum
-            self._raw_data[checksum_offset : checksum_offset + CHECKSUM_SIZE] = md5_hash
+            self.recalculate_slot_checksum(slot_idx)
 
         # Recalculate USER_DATA_10 checksum using tracked offset
         userdata10_offset = self._user_data_10_offset
@@ -284,6 +274,94 @@ class Save:
             userdata10_checksum_offset : userdata10_checksum_offset + CHECKSUM_SIZE
         ] = md5_hash
 
+    def slot_region(self, slot_idx: int) -> tuple[int, int]:
+        """
+        Get the (offset, length) of a character slot, checksum included
+
+        Returns:
+            Byte range of the slot within the raw data
+        """
+        SLOT_SIZE = 0x280000
+        CHECKSUM_SIZE = 0x10
+        return self._slot_offsets[slot_idx], CHECKSUM_SIZE + SLOT_SIZE
+
+    def recalculate_slot_checksum(self, slot_idx: int) -> tuple[int, int]:
+        """
+        Recalculate the MD5 checksum of a single character slot
+
+        Cheaper than recalculate_checksums() when only this slot changed.
+
+        Returns:
+            (offset, length) of the checksum within the raw data
+        """
+        import hashlib
+
+        SLOT_SIZE = 0x280000
+        CHECKSUM_SIZE = 0x10
+
+        # Use tracked offset for this slot
+        slot_offset = self._slot_offsets[slot_idx]
+        checksum_offset = slot_offset
+        data_offset = slot_offset + CHECKSUM_SIZE
+
+        # Calculate MD5 of character data
+        char_data = self._raw_data[data_offset : data_offset + SLOT_SIZE]
+        md5_hash = hashlib.md5(char_data).digest()
+
+        # Write checksum
+        self._raw_data[checksum_offset : checksum_offset + CHECKSUM_SIZE] = md5_hash
+        return checksum_offset, CHECKSUM_SIZE
+
+    def write_regions(
+        self,
+        filepath: str,
+        regions: list[tuple[int, int]],
+        verify: list[tuple[int, int]] | None = None,
+    ) -> bool:
+        """
+        Write only the given (offset, length) ranges of the raw data to disk.
+
+        The file is patched in place, so it must still hold this save (e.g. the
+        file it was loaded from) apart from the modified ranges. Pass the ranges
+        the written data depends on, such as the slot a checksum covers, as
+        verify: their bytes on disk are compared with the raw data first.
+
+        Args:
+            filepath: Path of the existing save file
+            regions: Byte ranges of the raw data to write
+            verify: Byte ranges that must already match on disk, apart from
+                the parts covered by regions
+
+        Returns:
+            False, without writing anything, if the file's size doesn't match
+            this save or a verify range differs; callers should fall back to
+            to_file()
+        """
+        try:
+            f = open(filepath, "r+b")
+        except OSError:
+            return False
+
+        with f, memoryview(self._raw_data) as data:
+            if os.fstat(f.fileno()).st_size != len(data):
+                return False
+
+            for start, length in verify or ():
+                f.seek(start)
+                on_disk = bytearray(f.read(length))
+                # The regions about to be written are allowed to differ
+                for offset, size in regions:
+                    lo, hi = max(offset, start), min(offset + size, start + length)
+                    if lo < hi:
+                        on_disk[lo - start : hi - start] = data[lo:hi]
+                if on_disk != data[start : start + length]:
+                    return False
+
+            for offset, length in regions:
+                f.seek(offset)
+                f.write(data[offset : offset + length])
+        return True
+
     def to_file(self, filepath: str):
         """
         Write save file to disk.
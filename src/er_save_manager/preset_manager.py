@@ -4,12 +4,33 @@ import json
 import os
 import platform
 import ssl
+import sys
 import tempfile
+import threading
 import time
 import urllib.request
 from pathlib import Path
 
 
+def _write_atomic(path: Path, write) -> None:
+    """Write a file through a temp file in the same folder, then swap it in.
+
+    Readers on other threads see either the old file or the complete new one,
+    never a partly written file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 class PresetManager:
     """Manage community character presets."""
 
@@ -29,8 +50,12 @@ class PresetManager:
             else:
                 self.cache_dir = Path.home() / ".cache" / "er-save-manager"
         else:
-            # Windows/macOS: use program directory
-            program_dir = Path(__file__).parent.parent.parent
+            # Windows/macOS: use program directory (next to the frozen exe, whose
+            # modules live inside library.zip)
+            if getattr(sys, "frozen", False):
+                program_dir = Path(sys.executable).parent
+            else:
+                program_dir = Path(__file__).parent.parent.parent
             self.cache_dir = program_dir / "data" / "presets"
 
         # Try to create cache directory, fallback to temp if permission denied
@@ -53,6 +78,10 @@ class PresetManager:
         self.full_images_dir.mkdir(exist_ok=True)
         print(f"[Image Cache] Full images directory: {self.full_images_dir}")
 
+        # Serializes downloads and thumbnail writes per preset across threads
+        self._preset_locks: dict[str, threading.Lock] = {}
+        self._preset_locks_guard = threading.Lock()
+
         # GitHub repo URL
         self.base_url = (
             "https://raw.githubusercontent.com/Hapfel1/er-character-presets/main/"
@@ -135,10 +164,17 @@ class PresetManager:
             # No cache available
             return {"version": "0.0.0", "presets": []}
 
+    def _preset_lock(self, preset_id: str) -> threading.Lock:
+        with self._preset_locks_guard:
+            return self._preset_locks.setdefault(preset_id, threading.Lock())
+
     def download_preset(self, preset_id: str, preset_info: dict) -> dict | None:
         """
         Download preset data and thumbnails (not full images).
 
+        Safe to call from several threads; a caller that waited for another
+        download of the same preset gets the freshly cached result instead.
+
         Args:
             preset_id: Preset ID
             preset_info: Preset metadata from index
@@ -146,6 +182,13 @@ class PresetManager:
         Returns:
             Preset data dict or None if failed
         """
+        with self._preset_lock(preset_id):
+            cached = self.get_cached_preset(preset_id)
+            if cached and "screenshot_path" in cached:
+                return cached
+            return self._download_preset(preset_id, preset_info)
+
+    def _download_preset(self, preset_id: str, preset_info: dict) -> dict | None:
         try:
             print(f"[Preset Download] Starting download for preset {preset_id}")
             # Download preset JSON
@@ -171,8 +214,9 @@ class PresetManager:
                 "hash": self._compute_data_hash(preset_data),
                 "preset_info_hash": self._compute_data_hash(preset_info),
             }
-            with open(preset_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f)
+            _write_atomic(
+                preset_path, lambda f: f.write(json.dumps(metadata).encode("utf-8"))
+            )
             print(f"[Preset Download] Cached preset data to {preset_path}")
 
             if thumbnail_path:
@@ -384,15 +428,36 @@ class PresetManager:
 
                 img = Image.open(io.BytesIO(image_data))
                 img.thumbnail(self.THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-                img.save(thumbnail_path, "PNG", optimize=True)
+                _write_atomic(
+                    thumbnail_path, lambda f: img.save(f, "PNG", optimize=True)
+                )
             except ImportError:
                 # PIL not available, save full image as thumbnail
-                thumbnail_path.write_bytes(image_data)
+                _write_atomic(thumbnail_path, lambda f: f.write(image_data))
 
             return thumbnail_path
         except Exception:
             return None
 
+    def save_thumbnail(self, preset_id: str, img) -> Path:
+        """
+        Store an already resized PIL image as a preset's cached thumbnail.
+
+        Args:
+            preset_id: Preset ID
+            img: PIL image no larger than THUMBNAIL_SIZE
+
+        Returns:
+            Path to the thumbnail
+        """
+        thumbnail_path = self.thumbnails_dir / f"{preset_id}.png"
+        with self._preset_lock(preset_id):
+            if not thumbnail_path.exists():
+                _write_atomic(
+                    thumbnail_path, lambda f: img.save(f, "PNG", optimize=True)
+                )
+        return thumbnail_path
+
     def _cleanup_cache(self):
         """
         Clean up cache:
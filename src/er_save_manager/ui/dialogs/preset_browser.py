@@ -5,7 +5,10 @@ Browse and contribute community appearance presets with 15-slot support.
 
 from __future__ import annotations
 
+import math
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tkinter import filedialog
 from typing import Any
@@ -17,7 +20,13 @@ from er_save_manager.preset_manager import PresetManager
 from er_save_manager.preset_metrics import PresetMetrics
 from er_save_manager.ui.messagebox import CTkMessageBox
 from er_save_manager.ui.progress_dialog import ProgressDialog
-from er_save_manager.ui.utils import bind_mousewheel, open_url, trace_variable
+from er_save_manager.ui.utils import (
+    bind_mousewheel,
+    global_bindings,
+    open_url,
+    trace_variable,
+    unbind_global_bindings_on_destroy,
+)
 
 try:
     from PIL import Image
@@ -26,11 +35,104 @@ try:
 except ImportError:
     HAS_PIL = False
 
+# Returned by thumbnail jobs skipped because their preset was no longer shown,
+# as opposed to None for a thumbnail that could not be loaded
+_THUMBNAIL_SKIPPED = object()
+
+
+def _open_image_for_size(path, size: tuple[int, int]) -> Image.Image:
+    """Open an image that will be shrunk to fit ``size``.
+
+    For JPEGs, draft() lets libjpeg decode at 1/2, 1/4 or 1/8 scale instead of
+    full resolution; other formats ignore it. Callers still thumbnail() after.
+    """
+    img = Image.open(path)
+    img.draft("RGB", size)
+    return img
+
+
+class _PresetCard(ctk.CTkFrame):
+    """Reusable preset card whose contents are swapped via ``update_from``."""
+
+    def __init__(self, master, height: int):
+        super().__init__(master, corner_radius=6, border_width=1, height=height)
+        # Fixed height keeps every grid row the same size for virtualization
+        self.pack_propagate(False)
+        self.preset: dict[str, Any] | None = None
+        self.grid_cell: tuple[int, int] | None = None
+
+        self.name_var = ctk.StringVar(value="")
+        self.author_var = ctk.StringVar(value="")
+        self.likes_var = ctk.StringVar(value="")
+        self.downloads_var = ctk.StringVar(value="")
+
+        self.thumb_label = ctk.CTkLabel(self, text="[Loading...]")
+        self.thumb_label.pack(pady=(8, 4))
+
+        ctk.CTkLabel(
+            self,
+            textvariable=self.name_var,
+            font=("Segoe UI", 11, "bold"),
+            wraplength=150,
+        ).pack(pady=(0, 2))
+        ctk.CTkLabel(
+            self,
+            textvariable=self.author_var,
+            font=("Segoe UI", 10),
+            text_color=("#6b7280", "#d1d5db"),
+        ).pack()
+
+        # Metrics display
+        metrics_frame = ctk.CTkFrame(self, fg_color="transparent")
+        metrics_frame.pack(pady=(4, 6))
+
+        # Likes
+        ctk.CTkLabel(
+            metrics_frame,
+            textvariable=self.likes_var,
+            font=("Segoe UI", 9),
+            text_color=("#6b7280", "#9ca3af"),
+        ).pack(side=ctk.LEFT, padx=4)
+
+        # Downloads
+        ctk.CTkLabel(
+            metrics_frame,
+            textvariable=self.downloads_var,
+            font=("Segoe UI", 9),
+            text_color=("#6b7280", "#9ca3af"),
+        ).pack(side=ctk.LEFT, padx=4)
+
+    def update_from(self, preset: dict[str, Any], metrics: dict[str, Any]):
+        if self.preset is not preset:
+            self.preset = preset
+            self.name_var.set(preset.get("name", "Unknown"))
+            self.author_var.set(f"by {preset.get('author', 'Unknown')}")
+            self.clear_thumbnail()
+        # Setting a StringVar redraws its label even when the text is the same
+        likes = f"👍 {metrics.get('thumbs_up', 0)}"
+        if self.likes_var.get() != likes:
+            self.likes_var.set(likes)
+        downloads = f"⬇ {metrics.get('downloads', 0)}"
+        if self.downloads_var.get() != downloads:
+            self.downloads_var.set(downloads)
+
+    def clear_thumbnail(self):
+        # CTkLabel ignores image=None, so drop the previous preset's image directly
+        self.thumb_label.configure(image=None, text="[Loading...]")
+        self.thumb_label._label.configure(image="")
+
 
 class EnhancedPresetBrowser:
     """Enhanced preset browser with Browse and Contribute tabs."""
 
     NUM_SLOTS = 15
+    CARD_COLUMNS = 3
+    CARD_HEIGHT = 250
+    CARD_PAD = 6
+    # Rows rendered beyond the viewport so scrolling doesn't expose blank cells
+    CARD_BUFFER_ROWS = 1
+    FILTER_DEBOUNCE_MS = 150
+    THUMBNAIL_CACHE_SIZE = 256
 
     def __init__(self, parent, appearance_tab):
         self.parent = parent
@@ -39,7 +141,23 @@ class EnhancedPresetBrowser:
         self.current_preset: dict[str, Any] | None = None
         self.all_presets: list[dict[str, Any]] = []
         self.filtered_presets: list[dict[str, Any]] = []
-        self.preset_widgets: list[ctk.CTkFrame] = []
+        # preset_id -> (name, author, tags) lowercased once per index load
+        self._search_keys: dict[str, tuple[str, str, frozenset[str]]] = {}
+        # sort mode -> all_presets in that order, built lazily and reused
+        self._sorted_views: dict[str, list[dict[str, Any]]] = {}
+        # Virtualized card grid: a small pool of cards is re-bound to whichever
+        # presets fall inside the visible rows instead of one card per preset
+        self._card_pool: list[_PresetCard] = []
+        self._grid_rows = 0
+        self._grid_row_height = 0
+        self._visible_refresh_id: str | None = None
+        self._filter_after_id: str | None = None
+        # Decoded card thumbnails (LRU by preset id) and the workers producing them
+        self._thumb_cache: OrderedDict[str, ctk.CTkImage] = OrderedDict()
+        self._thumb_pending: set[str] = set()
+        self._thumb_pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="preset-thumb"
+        )
 
         # Metrics integration
         from pathlib import Path
@@ -58,6 +176,7 @@ class EnhancedPresetBrowser:
         from er_save_manager.ui.utils import force_render_dialog
 
         self.dialog = ctk.CTkToplevel(self.parent)
+        bindings_before = global_bindings(self.dialog)
         self.dialog.title("Community Appearance Presets")
         self.dialog.geometry("1400x1000")
         self.dialog.transient(self.parent)
@@ -67,6 +186,10 @@ class EnhancedPresetBrowser:
         self.dialog.grab_set()
 
         def on_close():
+            if self._filter_after_id:
+                self.dialog.after_cancel(self._filter_after_id)
+                self._filter_after_id = None
+            self._thumb_pool.shutdown(wait=False, cancel_futures=True)
             self.dialog.grab_release()
             self.dialog.destroy()
 
@@ -80,6 +203,7 @@ class EnhancedPresetBrowser:
 
         self.setup_browse_tab()
         self.setup_contribute_tab()
+        unbind_global_bindings_on_destroy(self.dialog, bindings_before)
 
         # Force update and rendering on Linux
         self.dialog.update_idletasks()
@@ -112,7 +236,7 @@ class EnhancedPresetBrowser:
 
         ctk.CTkLabel(filter_frame, text="Search:").pack(side=ctk.LEFT, padx=(0, 8))
         self.search_var = ctk.StringVar(value="")
-        trace_variable(self.search_var, "w", lambda *args: self.apply_filters())
+        trace_variable(self.search_var, "w", lambda *args: self._schedule_filter())
         ctk.CTkEntry(filter_frame, textvariable=self.search_var, width=240).pack(
             side=ctk.LEFT
         )
@@ -125,10 +249,12 @@ class EnhancedPresetBrowser:
             values=["All", "Male", "Female", "Cosplay", "Original"],
             width=150,
             state="readonly",
-            command=lambda _value=None: self.apply_filters(),
+            command=lambda _value=None: self._schedule_filter(),
         )
         filter_combo.pack(side=ctk.LEFT)
-        filter_combo.bind("<<ComboboxSelected>>", lambda _e=None: self.apply_filters())
+        filter_combo.bind(
+            "<<ComboboxSelected>>", lambda _e=None: self._schedule_filter()
+        )
 
         ctk.CTkLabel(filter_frame, text="Sort:").pack(side=ctk.LEFT, padx=(18, 8))
         self.sort_var = ctk.StringVar(value="Recent")
@@ -138,10 +264,10 @@ class EnhancedPresetBrowser:
             values=["Recent", "Likes", "Downloads", "Name"],
             width=150,
             state="readonly",
-            command=lambda _value=None: self.apply_filters(),
+            command=lambda _value=None: self._schedule_filter(),
         )
         sort_combo.pack(side=ctk.LEFT)
-        sort_combo.bind("<<ComboboxSelected>>", lambda _e=None: self.apply_filters())
+        sort_combo.bind("<<ComboboxSelected>>", lambda _e=None: self._schedule_filter())
 
         content = ctk.CTkFrame(main_frame)
         content.pack(fill=ctk.BOTH, expand=True, pady=(0, 10))
@@ -159,6 +285,22 @@ class EnhancedPresetBrowser:
         )
         self.grid_container.grid(row=0, column=0, sticky="nsew", padx=(0, 12))
         bind_mousewheel(self.grid_container)
+        for i in range(self.CARD_COLUMNS):
+            self.grid_container.grid_columnconfigure(i, weight=1)
+
+        self.empty_label = ctk.CTkLabel(
+            self.grid_container, text="No presets match your search"
+        )
+
+        # Re-render the visible rows whenever the canvas scrolls or resizes
+        grid_canvas = self.grid_container._parent_canvas
+        grid_scrollbar = self.grid_container._scrollbar
+
+        def on_grid_scroll(first, last):
+            grid_scrollbar.set(first, last)
+            self._schedule_visible_refresh()
+
+        grid_canvas.configure(yscrollcommand=on_grid_scroll)
 
         preview_panel = ctk.CTkFrame(content, width=520)
         preview_panel.grid(row=0, column=1, sticky="nsew")
@@ -625,28 +767,27 @@ class EnhancedPresetBrowser:
         )
 
         def load_in_background():
+            # Network and cache I/O stay on this thread; browser state is only
+            # assigned on the Tk thread via dialog.after
             try:
                 index_data = self.manager.fetch_index(force_refresh=True)
-                self.all_presets = index_data.get("presets", [])
+                presets = index_data.get("presets", [])
 
-                if not self.all_presets:
-                    self.dialog.after(0, progress.close)
-                    self.dialog.after(
-                        0, lambda: self.status_var.set("No presets available yet")
-                    )
+                if not presets:
+                    self.dialog.after(0, self._on_index_loaded, [], {}, progress)
                     return
 
                 self.dialog.after(
                     0,
                     lambda: progress.update_status(
                         "Validating cache",
-                        f"Processing {len(self.all_presets)} presets...",
+                        f"Processing {len(presets)} presets...",
                     ),
                 )
 
                 # Validate cache entries in case index changed
                 invalidated_count = 0
-                for preset in self.all_presets:
+                for preset in presets:
                     is_valid, _ = self.manager.validate_preset_in_index(
                         preset["id"], preset
                     )
@@ -672,51 +813,27 @@ class EnhancedPresetBrowser:
                         f"Invalidated {invalidated_count} cached presets due to index changes"
                     )
 
-                self.dialog.after(
-                    0,
-                    lambda: progress.update_status(
-                        "Loading presets...", f"Loaded {len(self.all_presets)} presets"
-                    ),
-                )
-
                 # Load presets first so UI opens quickly
+                search_keys = self._build_search_keys(presets)
                 self.dialog.after(
-                    0,
-                    lambda: (
-                        self.status_var.set(f"Loaded {len(self.all_presets)} presets"),
-                        self.apply_filters(),
-                    ),
+                    0, self._on_index_loaded, presets, search_keys, progress
                 )
 
-                # Fetch metrics from Supabase asynchronously after UI loads
-                def load_metrics_async():
-                    try:
-                        preset_ids = [
-                            p.get("id") for p in self.all_presets if p.get("id")
-                        ]
-                        self.preset_metrics_cache = self.metrics.fetch_metrics(
-                            preset_ids
-                        )
-                        print(
-                            f"Fetched metrics for {len(self.preset_metrics_cache)} presets"
-                        )
-
-                        # Load user's likes from local settings (persisted across sessions)
-                        user_likes = self.metrics.fetch_user_likes(preset_ids)
-                        like_count = len([k for k, v in user_likes.items() if v])
-                        if like_count > 0:
-                            print(f"Loaded {like_count} user likes from local cache")
-
-                        # Refresh display with metrics and respect sort order
-                        self.apply_filters()
-                    except Exception as e:
-                        print(f"Failed to fetch metrics: {e}")
-                        self.preset_metrics_cache = {}
-
-                # Schedule async load after 10ms to allow UI to render first
-                self.dialog.after(10, load_metrics_async)
-                # Close progress after metrics load
-                self.dialog.after(100, progress.close)
+                # Fetch metrics from Supabase after the grid is populated
+                try:
+                    preset_ids = [p.get("id") for p in presets if p.get("id")]
+                    metrics = self.metrics.fetch_metrics(preset_ids)
+                    print(f"Fetched metrics for {len(metrics)} presets")
+
+                    # Load user's likes from local settings (persisted across sessions)
+                    user_likes = self.metrics.fetch_user_likes(preset_ids)
+                    like_count = len([k for k, v in user_likes.items() if v])
+                    if like_count > 0:
+                        print(f"Loaded {like_count} user likes from local cache")
+                except Exception as e:
+                    print(f"Failed to fetch metrics: {e}")
+                    metrics = {}
+                self.dialog.after(0, self._on_metrics_loaded, metrics)
 
             except Exception as exc:  # pragma: no cover - UI path
                 self.dialog.after(0, progress.close)
@@ -731,34 +848,105 @@ class EnhancedPresetBrowser:
         thread = threading.Thread(target=load_in_background, daemon=True)
         thread.start()
 
-    def apply_filters(self):
+    def _on_index_loaded(
+        self,
+        presets: list[dict[str, Any]],
+        search_keys: dict[str, tuple[str, str, frozenset[str]]],
+        progress: ProgressDialog,
+    ):
+        progress.close()
+        if not self.dialog.winfo_exists():
+            return
+
+        self._search_keys = search_keys
+        self._sorted_views = {}
+        self.all_presets = presets
+
+        if not presets:
+            self.status_var.set("No presets available yet")
+            return
+
+        self.status_var.set(f"Loaded {len(presets)} presets")
+        self.apply_filters()
+
+    def _on_metrics_loaded(self, metrics: dict[str, dict]):
+        if not self.dialog.winfo_exists():
+            return
+
+        self.preset_metrics_cache = metrics
+        self._invalidate_metric_sorts()
+        # Metrics arrive after the grid is shown; keep the user's scroll position
+        if self.sort_var.get() in ("Likes", "Downloads"):
+            self.apply_filters(reset_scroll=False)
+            return
+        for card in self._card_pool:
+            if card.grid_cell is not None and card.preset is not None:
+                card.update_from(card.preset, metrics.get(card.preset["id"], {}))
+
+    def _schedule_filter(self):
+        """Debounce filter input so a burst of keystrokes triggers one refilter."""
+        if self._filter_after_id:
+            self.dialog.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.dialog.after(
+            self.FILTER_DEBOUNCE_MS, self._run_filter
+        )
+
+    def _run_filter(self):
+        self._filter_after_id = None
+        self.apply_filters()
+
+    @staticmethod
+    def _build_search_keys(
+        presets: list[dict[str, Any]],
+    ) -> dict[str, tuple[str, str, frozenset[str]]]:
+        """Lowercase the searchable fields once instead of on every filter pass.
+
+        Kept out of the preset dicts themselves because those are hashed by
+        PresetManager to validate the cache against the index.
+        """
+        keys = {}
+        for preset in presets:
+            raw_tags = preset.get("tags", [])
+            if isinstance(raw_tags, str):
+                raw_tags = raw_tags.split(",")
+            keys[preset["id"]] = (
+                preset.get("name", "").lower(),
+                preset.get("author", "").lower(),
+                frozenset(t.strip().lower() for t in raw_tags if t.strip()),
+            )
+        return keys
+
+    def apply_filters(self, reset_scroll: bool = True):
         search_term = self.search_var.get().lower()
         filter_tag = self.filter_var.get().lower()
         self.filtered_presets = []
 
-        for preset in self.all_presets:
-            if search_term:
-                name_match = search_term in preset.get("name", "").lower()
-                author_match = search_term in preset.get("author", "").lower()
-                if not (name_match or author_match):
-                    continue
+        # Walk a presorted view so filtering preserves order without re-sorting
+        for preset in self._sorted_view(self.sort_var.get()):
+            name_lc, author_lc, tags_lc = self._search_keys[preset["id"]]
+            if search_term and not (search_term in name_lc or search_term in author_lc):
+                continue
 
-            if filter_tag != "all":
-                raw_tags = preset.get("tags", [])
-                if isinstance(raw_tags, str):
-                    tags = [t.strip().lower() for t in raw_tags.split(",") if t.strip()]
-                else:
-                    tags = [t.lower() for t in raw_tags]
-                if filter_tag not in tags:
-                    continue
+            if filter_tag != "all" and filter_tag not in tags_lc:
+                continue
 
             self.filtered_presets.append(preset)
 
-        sort_mode = self.sort_var.get()
+        self.display_presets(reset_scroll)
+
+    def _sorted_view(self, sort_mode: str) -> list[dict[str, Any]]:
+        """Return all presets ordered by ``sort_mode``, sorting at most once."""
+        view = self._sorted_views.get(sort_mode)
+        if view is not None:
+            return view
+
         if sort_mode == "Recent":
-            self.filtered_presets.sort(key=lambda p: p.get("created", ""), reverse=True)
+            view = sorted(
+                self.all_presets, key=lambda p: p.get("created", ""), reverse=True
+            )
         elif sort_mode == "Likes":
-            self.filtered_presets.sort(
+            view = sorted(
+                self.all_presets,
                 key=lambda p: (
                     self.preset_metrics_cache.get(p.get("id", ""), {}).get(
                         "thumbs_up", 0
@@ -768,7 +956,8 @@ class EnhancedPresetBrowser:
                 reverse=True,
             )
         elif sort_mode == "Downloads":
-            self.filtered_presets.sort(
+            view = sorted(
+                self.all_presets,
                 key=lambda p: (
                     self.preset_metrics_cache.get(p.get("id", ""), {}).get(
                         "downloads", 0
@@ -778,139 +967,252 @@ class EnhancedPresetBrowser:
                 reverse=True,
             )
         else:
-            self.filtered_presets.sort(key=lambda p: p.get("name", "").lower())
+            view = sorted(self.all_presets, key=lambda p: self._search_keys[p["id"]][0])
+
+        self._sorted_views[sort_mode] = view
+        return view
+
+    def _invalidate_metric_sorts(self):
+        self._sorted_views.pop("Likes", None)
+        self._sorted_views.pop("Downloads", None)
+
+    def display_presets(self, reset_scroll: bool = True):
+        count = len(self.filtered_presets)
+        rows = -(-count // self.CARD_COLUMNS)
+
+        # Reserve the full grid height up front so the scrollbar reflects every
+        # preset even though only the visible rows hold real cards
+        # Only rows whose size actually changes are reconfigured; each call
+        # queues another grid relayout of the whole container
+        row_height = self._card_row_height()
+        if row_height == self._grid_row_height:
+            changed_rows = range(min(rows, self._grid_rows), max(rows, self._grid_rows))
+        else:
+            changed_rows = range(max(rows, self._grid_rows))
+        for row in changed_rows:
+            self.grid_container.grid_rowconfigure(
+                row, minsize=row_height if row < rows else 0
+            )
+        self._grid_rows = rows
+        self._grid_row_height = row_height
 
-        self.display_presets()
+        if count:
+            self.empty_label.grid_forget()
+        else:
+            self.empty_label.grid(
+                row=0, column=0, columnspan=self.CARD_COLUMNS, pady=30, padx=10
+            )
 
-    def display_presets(self):
-        for widget in self.preset_widgets:
-            widget.destroy()
-        self.preset_widgets.clear()
+        if reset_scroll:
+            self.grid_container._parent_canvas.yview_moveto(0)
+        self._render_visible_cards()
 
-        if not self.filtered_presets:
-            empty = ctk.CTkLabel(
-                self.grid_container, text="No presets match your search"
+    def _schedule_visible_refresh(self):
+        if self._visible_refresh_id is None:
+            self._visible_refresh_id = self.dialog.after_idle(
+                self._render_visible_cards
             )
-            empty.grid(row=0, column=0, pady=30, padx=10)
-            self.preset_widgets.append(empty)
-            return
 
-        row = col = 0
-        for preset in self.filtered_presets:
-            card = self.create_preset_card(preset)
-            card.grid(row=row, column=col, padx=6, pady=6, sticky="nsew")
-            self.preset_widgets.append(card)
-            col += 1
-            if col >= 3:
-                col = 0
-                row += 1
-
-        for i in range(3):
-            self.grid_container.grid_columnconfigure(i, weight=1)
+    def _card_row_height(self) -> int:
+        # Cards and their padding are scaled by CTk, grid minsize is not
+        return round(
+            self.grid_container._apply_widget_scaling(
+                self.CARD_HEIGHT + 2 * self.CARD_PAD
+            )
+        )
+
+    def _visible_row_range(self) -> tuple[int, int]:
+        """Return the [first, last) grid rows currently inside the viewport."""
+        if not self._grid_rows:
+            return 0, 0
+        canvas = self.grid_container._parent_canvas
+        row_height = self._card_row_height()
+        top = canvas.canvasy(0)
+        # Before the first layout pass the canvas reports a 1px height
+        height = max(canvas.winfo_height(), row_height)
+        start = int(top // row_height) - self.CARD_BUFFER_ROWS
+        end = math.ceil((top + height) / row_height) + self.CARD_BUFFER_ROWS
+        return max(start, 0), min(end, self._grid_rows)
+
+    def _render_visible_cards(self):
+        self._visible_refresh_id = None
+        try:
+            if not self.dialog.winfo_exists():
+                return
+        except tk.TclError:
+            return
 
-    def create_preset_card(self, preset: dict[str, Any]):
-        frame = ctk.CTkFrame(self.grid_container, corner_radius=6, border_width=1)
-        frame.preset = preset
+        start_row, end_row = self._visible_row_range()
+        columns = self.CARD_COLUMNS
+        start = start_row * columns
+        end = min(end_row * columns, len(self.filtered_presets))
+
+        # Cards still in view keep their cell; only the freed ones are re-bound
+        # to the presets that scrolled in
+        placed = {}
+        free = []
+        for card in self._card_pool:
+            index = None
+            if card.grid_cell is not None:
+                index = card.grid_cell[0] * columns + card.grid_cell[1]
+            if index is not None and start <= index < end:
+                placed[index] = card
+            else:
+                free.append(card)
+
+        while len(placed) + len(free) < end - start:
+            card = self.create_preset_card()
+            self._card_pool.append(card)
+            free.append(card)
+
+        for index in range(start, end):
+            card = placed.get(index)
+            if card is None:
+                card = free.pop()
+                cell = divmod(index, columns)
+                card.grid(
+                    row=cell[0],
+                    column=cell[1],
+                    padx=self.CARD_PAD,
+                    pady=self.CARD_PAD,
+                    sticky="nsew",
+                )
+                card.grid_cell = cell
+            # A kept card's preset only differs after the filtered list changed
+            self.update_preset_card(card, self.filtered_presets[index])
+
+        for card in free:
+            if card.grid_cell is not None:
+                card.grid_forget()
+                card.grid_cell = None
+
+    def create_preset_card(self) -> _PresetCard:
+        card = _PresetCard(self.grid_container, height=self.CARD_HEIGHT)
+
+        # One shared handler resolves the clicked card from the event widget
+        pending = [card]
+        while pending:
+            widget = pending.pop()
+            widget.bind("<Button-1>", self._on_card_click)
+            widget.configure(cursor="hand2")
+            # CTk widgets forward bind() to their internal tk parts themselves
+            pending.extend(
+                child
+                for child in widget.winfo_children()
+                if isinstance(child, ctk.CTkBaseClass)
+            )
+        return card
 
-        thumb = ctk.CTkLabel(frame, text="[Loading...]")
-        thumb.pack(pady=(8, 4))
-        frame.thumb_label = thumb
+    def update_preset_card(self, card: _PresetCard, preset: dict[str, Any]):
+        rebound = card.preset is not preset
+        metrics = self.preset_metrics_cache.get(preset.get("id", ""), {})
+        card.update_from(preset, metrics)
+        if not rebound:
+            return
 
         if HAS_PIL:
-            self.load_thumbnail(preset, thumb)
+            self.load_thumbnail(preset)
         else:
-            thumb.configure(text="[No image]")
+            card.thumb_label.configure(text="[No image]")
 
-        ctk.CTkLabel(
-            frame,
-            text=preset.get("name", "Unknown"),
-            font=("Segoe UI", 11, "bold"),
-            wraplength=150,
-        ).pack(pady=(0, 2))
-        ctk.CTkLabel(
-            frame,
-            text=f"by {preset.get('author', 'Unknown')}",
-            font=("Segoe UI", 10),
-            text_color=("#6b7280", "#d1d5db"),
-        ).pack()
+    def _on_card_click(self, event):
+        widget = event.widget
+        while widget is not None and not isinstance(widget, _PresetCard):
+            widget = getattr(widget, "master", None)
+        if widget is not None and widget.preset is not None:
+            self.preview_preset(widget.preset)
 
-        # Metrics display
-        preset_id = preset.get("id", "")
-        metrics = self.preset_metrics_cache.get(preset_id, {})
-        likes = metrics.get("thumbs_up", 0)
-        downloads = metrics.get("downloads", 0)
+    def load_thumbnail(self, preset: dict[str, Any]):
+        preset_id = preset["id"]
+        cached_img = self._thumb_cache.get(preset_id)
+        if cached_img is not None:
+            self._thumb_cache.move_to_end(preset_id)
+            self._show_thumbnail(preset, cached_img)
+            return
 
-        metrics_frame = ctk.CTkFrame(frame, fg_color="transparent")
-        metrics_frame.pack(pady=(4, 6))
+        if preset_id in self._thumb_pending:
+            return
+        self._thumb_pending.add(preset_id)
+        future = self._thumb_pool.submit(self._decode_thumbnail, preset)
 
-        # Likes
-        ctk.CTkLabel(
-            metrics_frame,
-            text=f"👍 {likes}",
-            font=("Segoe UI", 9),
-            text_color=("#6b7280", "#9ca3af"),
-        ).pack(side=ctk.LEFT, padx=4)
+        def on_done(fut):
+            try:
+                self.dialog.after(0, self._on_thumbnail_decoded, preset, fut)
+            except (RuntimeError, tk.TclError):
+                pass  # Dialog closed while decoding
 
-        # Downloads
-        ctk.CTkLabel(
-            metrics_frame,
-            text=f"⬇ {downloads}",
-            font=("Segoe UI", 9),
-            text_color=("#6b7280", "#9ca3af"),
-        ).pack(side=ctk.LEFT, padx=4)
+        future.add_done_callback(on_done)
 
-        for widget in frame.winfo_children():
-            widget.bind("<Button-1>", lambda _e, p=preset: self.preview_preset(p))
-            widget.configure(cursor="hand2")
-        frame.bind("<Button-1>", lambda _e, p=preset: self.preview_preset(p))
-        frame.configure(cursor="hand2")
-        return frame
+    def _decode_thumbnail(self, preset: dict[str, Any]) -> Image.Image | object | None:
+        """Load (downloading if needed) and shrink a card thumbnail off the Tk thread."""
+        # Skip work for presets that were scrolled out before the job started
+        if not any(card.preset is preset for card in self._card_pool):
+            return _THUMBNAIL_SKIPPED
 
-    def load_thumbnail(self, preset: dict[str, Any], label: ctk.CTkLabel):
         preset_id = preset["id"]
         cached = self.manager.get_cached_preset(preset_id)
-        if cached and "screenshot_path" in cached:
+        if not cached or "screenshot_path" not in cached:
+            cached = self.manager.download_preset(preset_id, preset)
+        if not cached or "screenshot_path" not in cached:
+            return None
+
+        screenshot_path = Path(cached["screenshot_path"])
+        size = self.manager.THUMBNAIL_SIZE
+        img = _open_image_for_size(screenshot_path, size)
+        if img.width <= size[0] and img.height <= size[1]:
+            # Already a pre-resized thumbnail from the on-disk cache
+            img.load()
+            return img
+
+        img.thumbnail(size)
+        # Legacy cache entries point at the full screenshot; persist the resized
+        # copy where get_cached_preset looks first so later runs skip this decode
+        if screenshot_path != self.manager.thumbnails_dir / f"{preset_id}.png":
             try:
-                img = Image.open(cached["screenshot_path"])
-                img.thumbnail((150, 150))
-                actual_size = img.size
-                label.configure(
-                    image=self._make_ctk_image(img, actual_size),
-                    text="",
-                    width=actual_size[0],
-                    height=actual_size[1],
-                    anchor="center",
-                )
-                return
-            except Exception:
-                pass
+                self.manager.save_thumbnail(preset_id, img)
+            except Exception as e:
+                print(f"[Image Cache] Failed to save thumbnail for {preset_id}: {e}")
+        return img
 
-        label.configure(text="[Downloading...]")
-        self.dialog.after(
-            0, lambda: self._download_and_display_thumbnail(preset, label)
-        )
+    def _on_thumbnail_decoded(self, preset: dict[str, Any], future):
+        preset_id = preset["id"]
+        self._thumb_pending.discard(preset_id)
+        if not self.dialog.winfo_exists():
+            return
 
-    def _download_and_display_thumbnail(
-        self, preset: dict[str, Any], label: ctk.CTkLabel
-    ):
         try:
-            preset_id = preset["id"]
-            downloaded = self.manager.download_preset(preset_id, preset)
-            if downloaded and "screenshot_path" in downloaded:
-                img = Image.open(downloaded["screenshot_path"])
-                img.thumbnail((150, 150))
-                actual_size = img.size
-                label.configure(
-                    image=self._make_ctk_image(img, actual_size),
+            img = future.result()
+        except Exception:
+            img = None
+        if img is _THUMBNAIL_SKIPPED:
+            # Scrolled back into view before the skipped job reported back
+            if any(card.preset is preset for card in self._card_pool):
+                self.load_thumbnail(preset)
+            return
+        ctk_img = self._make_ctk_image(img, img.size) if img is not None else None
+
+        if ctk_img is None:
+            for card in self._card_pool:
+                if card.preset is preset:
+                    card.thumb_label.configure(text="[No Image]")
+            return
+
+        self._thumb_cache[preset_id] = ctk_img
+        if len(self._thumb_cache) > self.THUMBNAIL_CACHE_SIZE:
+            self._thumb_cache.popitem(last=False)
+        self._show_thumbnail(preset, ctk_img)
+
+    def _show_thumbnail(self, preset: dict[str, Any], ctk_img: ctk.CTkImage):
+        width, height = ctk_img.cget("size")
+        for card in self._card_pool:
+            if card.preset is preset:
+                card.thumb_label.configure(
+                    image=ctk_img,
                     text="",
-                    width=actual_size[0],
-                    height=actual_size[1],
+                    width=width,
+                    height=height,
                     anchor="center",
                 )
-                return
-        except Exception:
-            pass
-        label.configure(text="[No Image]")
 
     def preview_preset(self, preset: dict[str, Any]):
         self.current_preset = preset
@@ -956,7 +1258,9 @@ class EnhancedPresetBrowser:
                         ctk.CTkLabel(body_col, text="Body").pack()
                 elif "screenshot_path" in cached:
                     try:
-                        img = Image.open(cached["screenshot_path"])
+                        img = _open_image_for_size(
+                            cached["screenshot_path"], (320, 320)
+                        )
                         img.thumbnail((320, 320))
                         ctk_img = self._make_ctk_image(img, (320, 320))
                         if ctk_img:
@@ -1045,6 +1349,7 @@ class EnhancedPresetBrowser:
             updated_metrics = self.metrics.fetch_metrics([preset_id])
             if updated_metrics:
                 self.preset_metrics_cache.update(updated_metrics)
+                self._invalidate_metric_sorts()
             # Refresh preview to show updated state
             self.preview_preset(preset)
 
@@ -1086,7 +1391,7 @@ class EnhancedPresetBrowser:
         if cache_dir.exists():
             for img_file in cache_dir.glob(f"*{suffix}.*"):
                 try:
-                    img = Image.open(img_file)
+                    img = _open_image_for_size(img_file, size)
                     img = img.copy()
                     img.thumbnail(size, Image.LANCZOS)
                     return self._make_ctk_image(img, img.size)
@@ -1097,7 +1402,7 @@ class EnhancedPresetBrowser:
             try:
                 path = self.manager.download_image(preset["id"], preset[key], suffix)
                 if path and path.exists():
-                    img = Image.open(path)
+                    img = _open_image_for_size(path, size)
                     img = img.copy()
                     img.thumbnail(size, Image.LANCZOS)
                     return self._make_ctk_image(img, img.size)
@@ -1106,25 +1411,12 @@ class EnhancedPresetBrowser:
         return None
 
     def _refresh_all_thumbnails(self):
-        for card in self.preset_widgets:
-            if hasattr(card, "preset") and hasattr(card, "thumb_label"):
-                preset = card.preset
-                label = card.thumb_label
-                cached = self.manager.get_cached_preset(preset["id"])
-                if cached and "screenshot_path" in cached and HAS_PIL:
-                    try:
-                        img = Image.open(cached["screenshot_path"])
-                        img.thumbnail((150, 150))
-                        actual_size = img.size
-                        label.configure(
-                            image=self._make_ctk_image(img, actual_size),
-                            text="",
-                            width=actual_size[0],
-                            height=actual_size[1],
-                            anchor="center",
-                        )
-                    except Exception:
-                        pass
+        if not HAS_PIL:
+            return
+        # Retry cards whose thumbnail failed before the preset was downloaded
+        for card in self._card_pool:
+            if card.preset is not None and card.winfo_ismapped():
+                self.load_thumbnail(card.preset)
 
     def apply_to_slot(self):
         if not self.current_preset:
@@ -1198,6 +1490,7 @@ class EnhancedPresetBrowser:
                 updated_metrics = self.metrics.fetch_metrics([preset_id])
                 if updated_metrics:
                     self.preset_metrics_cache.update(updated_metrics)
+                    self._invalidate_metric_sorts()
                 # Refresh preview to show updated download count
                 self.preview_preset(self.current_preset)
 
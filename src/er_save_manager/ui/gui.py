@@ -194,16 +194,13 @@ class SaveManagerGUI:
 
     def _check_for_updates(self):
         """Check for application updates in a background thread"""
+        # Check if user wants to see update notifications
+        if not self.settings.get("show_update_notifications", True):
+            return
 
-        def check_in_thread():
+        def on_result(result):
             try:
-                # Check if user wants to see update notifications
-                if not self.settings.get("show_update_notifications", True):
-                    return
-
-                checker = VersionChecker(__version__)
-                has_update, latest_version, download_url = checker.check_for_updates()
-
+                has_update, latest_version, download_url = result
                 if has_update and latest_version and download_url:
                     # Schedule the dialog to show on the main thread
                     self.root.after(
@@ -215,11 +212,11 @@ class SaveManagerGUI:
                 # Silently fail on update check errors
                 print(f"Update check failed: {e}")
 
-        # Run check in background thread
-        import threading
-
-        thread = threading.Thread(target=check_in_thread, daemon=True)
-        thread.start()
+        checker = VersionChecker(
+            __version__,
+            cache_file=self.settings.settings_file.parent / "update_check.json",
+        )
+        checker.check_async(on_result)
 
     def _handle_game_running_dialog(self, profile=None) -> bool:
         """
@@ -9,7 +9,12 @@ import tkinter as tk
 import customtkinter as ctk
 
 from er_save_manager.ui.messagebox import CTkMessageBox
-from er_save_manager.ui.utils import bind_mousewheel, force_render_dialog
+from er_save_manager.ui.utils import (
+    bind_mousewheel,
+    force_render_dialog,
+    global_bindings,
+    unbind_global_bindings_on_destroy,
+)
 
 
 class QuestProgressDialog:
@@ -33,6 +38,7 @@ class QuestProgressDialog:
         from er_save_manager.data.quest_flags_db import QUEST_FLAGS
 
         dialog = ctk.CTkToplevel(parent)
+        bindings_before = global_bindings(dialog)
         dialog.title("Quest Progress")
         width, height = 900, 650
         dialog.transient(parent)
@@ -95,6 +101,7 @@ class QuestProgressDialog:
         )
         steps_scroll.grid(row=1, column=0, sticky="nsew", padx=6, pady=(0, 6))
         bind_mousewheel(steps_scroll)
+        unbind_global_bindings_on_destroy(dialog, bindings_before)
 
         # ---- Bottom bar ----
         bottom = ctk.CTkFrame(dialog, fg_color="transparent")
@@ -126,6 +133,9 @@ class QuestProgressDialog:
         selected_npc = tk.StringVar(value="")
         npc_buttons = {}
         step_widgets = []  # list of (step_dict, completion_label, apply_btn)
+        # Containers for the rebuilt lists, destroyed in one call on rebuild
+        steps_list = None
+        npc_list = None
 
         def _safe_get_flag(flag_id):
             try:
@@ -143,9 +153,12 @@ class QuestProgressDialog:
             return sum(1 for s in steps if _step_is_complete(s)), len(steps)
 
         def _render_steps(npc_name):
+            nonlocal steps_list
             # Clear old widgets
-            for w in steps_scroll.winfo_children():
-                w.destroy()
+            if steps_list is not None:
+                steps_list.destroy()
+            steps_list = ctk.CTkFrame(steps_scroll, fg_color="transparent")
+            steps_list.pack(fill=tk.X)
             step_widgets.clear()
 
             steps = QUEST_FLAGS[npc_name]
@@ -158,7 +171,7 @@ class QuestProgressDialog:
                 border = ("#86efac", "#166534") if complete else ("#e2e8f0", "#2d2d44")
 
                 row_frame = ctk.CTkFrame(
-                    steps_scroll,
+                    steps_list,
                     corner_radius=6,
                     fg_color=color,
                     border_color=border,
@@ -335,8 +348,11 @@ class QuestProgressDialog:
 
         # ---- NPC button rendering ----
         def _rebuild_npc_list(query=""):
-            for w in npc_list_frame.winfo_children():
-                w.destroy()
+            nonlocal npc_list
+            if npc_list is not None:
+                npc_list.destroy()
+            npc_list = ctk.CTkFrame(npc_list_frame, fg_color="transparent")
+            npc_list.pack(fill=tk.X)
             npc_buttons.clear()
 
             query = query.lower().strip()
@@ -357,7 +373,7 @@ class QuestProgressDialog:
                 is_active = npc_name == active
                 bg = ("#e0e7ff", "#1e1b4b") if is_active else "transparent"
 
-                btn_frame = ctk.CTkFrame(npc_list_frame, fg_color=bg, corner_radius=6)
+                btn_frame = ctk.CTkFrame(npc_list, fg_color=bg, corner_radius=6)
                 btn_frame.pack(fill=tk.X, pady=2)
 
                 ctk.CTkLabel(
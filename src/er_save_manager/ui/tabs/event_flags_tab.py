@@ -3,7 +3,9 @@ Event Flags Tab (customtkinter version)
 Comprehensive event flag viewer and editor with 948 documented flags
 """
 
+import math
 import tkinter as tk
+from pathlib import Path
 
 import customtkinter as ctk
 
@@ -18,10 +20,15 @@ from er_save_manager.data.event_flags_db import (
     get_category_flags,
     get_flag_name,
     get_subcategories,
+    search_flags,
 )
 from er_save_manager.parser.event_flags import EventFlags
 from er_save_manager.ui.messagebox import CTkMessageBox
-from er_save_manager.ui.utils import bind_mousewheel
+from er_save_manager.ui.utils import (
+    bind_mousewheel,
+    global_bindings,
+    unbind_global_bindings_on_destroy,
+)
 
 
 class EventFlagsTab:
@@ -32,20 +39,40 @@ class EventFlagsTab:
 
         def __init__(self, slot):
             self.slot = slot
-            # Keep a mutable buffer for repeated writes
-            self.buffer = (
-                bytearray(slot.event_flags)
-                if not isinstance(slot.event_flags, bytearray)
-                else slot.event_flags
-            )
+            # Convert once and edit the slot's flags in place, so reads and
+            # writes never copy the 1.8 MB buffer
+            if not isinstance(slot.event_flags, bytearray):
+                slot.event_flags = bytearray(slot.event_flags)
+            self.buffer = slot.event_flags
 
         def get_flag(self, flag_id: int) -> bool:
-            return EventFlags.get_flag(bytes(self.buffer), flag_id)
+            return EventFlags.get_flag(self.buffer, flag_id)
+
+        def get_flags(self, flag_ids) -> list[bool]:
+            """Read many flags in one pass over the buffer."""
+            return EventFlags.get_flags_bulk(self.buffer, flag_ids)
 
         def set_flag(self, flag_id: int, state: bool) -> None:
             EventFlags.set_flag(self.buffer, flag_id, state)
-            # Persist back onto the slot so saves use updated bytes
-            self.slot.event_flags = bytes(self.buffer)
+
+        def set_flags(self, changes) -> None:
+            """Apply (flag_id, state) pairs to the slot's buffer."""
+            EventFlags.set_flags_bulk(self.buffer, changes)
+
+    class _FlagRow:
+        """Pooled checkbox reused for whichever flag row scrolls into view."""
+
+        def __init__(self, master, on_toggle):
+            self.flag_id = None
+            self.row = None
+            self.text = ""
+            self.var = tk.BooleanVar(value=False)
+            self.checkbox = ctk.CTkCheckBox(
+                master,
+                text="",
+                variable=self.var,
+                command=lambda: on_toggle(self.flag_id, self.var),
+            )
 
     def __init__(
         self,
@@ -76,9 +103,19 @@ class EventFlagsTab:
         self.subcategory_var = None
         self.search_var = None
         self.flag_states = {}  # Track checkbox states
-        self.flag_widgets = {}  # Track checkbox widgets
         self.current_event_flags = None
 
+        # Virtualized flag list: (flag_id, label) for every listed flag, and a
+        # small pool of checkboxes placed only over the rows in view
+        self._flag_rows: list[tuple[int, str]] = []
+        self._flag_row_states: list[bool] = []  # saved state of each listed flag
+        self._flag_row_pool: list[EventFlagsTab._FlagRow] = []
+        self._flags_refresh_id = None
+
+        self._search_after_id = None
+        self._last_search_term = None
+        self._backup_manager = None
+
     def _get_slot_display_names(self):
         """Get display names for all slots"""
         save_file = self.get_save_file()  # or self.save_file depending on class
@@ -279,7 +316,7 @@ class EventFlagsTab:
 
         ctk.CTkLabel(search_inner, text="Search:").pack(side=tk.LEFT, padx=(0, 8))
         self.search_var = tk.StringVar(value="")
-        self.search_var.trace_add("write", self.on_search_changed)
+        self.search_var.trace_add("write", self._schedule_search)
         search_entry = ctk.CTkEntry(
             search_inner, textvariable=self.search_var, width=320
         )
@@ -312,6 +349,23 @@ class EventFlagsTab:
         self.flags_inner_frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=(0, 12))
         bind_mousewheel(self.flags_inner_frame)
 
+        # Sized to the full list so the scrollregion covers every row, while
+        # only the pooled checkboxes in view are placed on top of it
+        self._flags_spacer = ctk.CTkFrame(
+            self.flags_inner_frame, fg_color="transparent", height=1
+        )
+        self._flags_spacer.pack(fill=tk.X)
+
+        # Re-place the rows whenever the list scrolls or resizes
+        flags_canvas = self.flags_inner_frame._parent_canvas
+        flags_scrollbar = self.flags_inner_frame._scrollbar
+
+        def on_flags_scroll(*args):
+            flags_scrollbar.set(*args)
+            self._schedule_flag_rows_refresh()
+
+        flags_canvas.configure(yscrollcommand=on_flags_scroll)
+
         # Action buttons area
         action_frame = ctk.CTkFrame(flags_frame, fg_color="transparent")
         action_frame.pack(fill=tk.X, padx=12, pady=(0, 12))
@@ -351,9 +405,7 @@ class EventFlagsTab:
 
         self.current_event_flags = self._EventFlagAccessor(slot)
         self.flag_states.clear()
-        self.flag_widgets.clear()
-        for widget in self.flags_inner_frame.winfo_children():
-            widget.destroy()
+        self.show_flag_rows([])
 
         self.status_label.configure(
             text=f"Loaded Slot {slot_idx + 1}. Select category or search."
@@ -376,7 +428,7 @@ class EventFlagsTab:
         # Update subcategories
         subcats = get_subcategories(category)
         if subcats:
-            self.subcat_combo.configure(values=["All"] + subcats, state="readonly")
+            self.subcat_combo.configure(values=["All", *subcats], state="readonly")
             self.subcategory_var.set("All")
             self.on_subcategory_changed()
         else:
@@ -397,146 +449,156 @@ class EventFlagsTab:
             self.display_flags(category, None if subcategory == "All" else subcategory)
 
     def display_flags(self, category, subcategory):
-        """Display flags for category/subcategory, rendered in chunks to avoid X11 BadAlloc."""
-        for widget in self.flags_inner_frame.winfo_children():
-            widget.destroy()
-        self.flag_widgets.clear()
-
+        """Display flags for category/subcategory"""
         flags = get_category_flags(category, subcategory)
-        total = len(flags)
+        self.show_flag_rows(
+            [(flag_id, f"{flag_id}: {get_flag_name(flag_id)}") for flag_id in flags]
+        )
 
         label = f"{category} > {subcategory}" if subcategory else category
-        self.status_label.configure(text=f"Loading {total} flags in {label}...")
-
-        self._render_flags_chunk(flags, 0, total, label)
-
-    _RENDER_CHUNK = 25  # flags per batch
-    _RENDER_DELAY = 20  # ms between batches - gives X11 time to flush
-
-    def _render_flags_chunk(self, flags, offset, total, label):
-        """Render one chunk of flags, then schedule the next batch."""
-        chunk = flags[offset : offset + self._RENDER_CHUNK]
-
-        for flag_id in chunk:
-            flag_name = get_flag_name(flag_id)
-            is_set = self.current_event_flags.get_flag(flag_id)
-
-            if flag_id not in self.flag_states:
-                self.flag_states[flag_id] = is_set
-
-            var = tk.BooleanVar(value=is_set)
-
-            checkbox = ctk.CTkCheckBox(
-                self.flags_inner_frame,
-                text=f"{flag_id}: {flag_name}",
-                variable=var,
-                command=lambda fid=flag_id, v=var: self.on_flag_toggled(fid, v),
+        self.status_label.configure(text=f"Showing {len(flags)} flags in {label}")
+
+    _FLAG_ROW_HEIGHT = 28  # checkbox height plus vertical padding
+    _FLAG_BUFFER_ROWS = 2  # rows kept placed above and below the viewport
+
+    def show_flag_rows(self, rows):
+        """Replace the listed flags with rows of (flag_id, label)."""
+        self._flag_rows = rows
+        self._last_search_term = None
+        self._hydrate_flag_rows()
+        for row in self._flag_row_pool:
+            if row.row is not None:
+                row.checkbox.place_forget()
+                row.row = None
+        self._flags_spacer.configure(height=max(len(rows) * self._FLAG_ROW_HEIGHT, 1))
+        self.flags_inner_frame._parent_canvas.yview_moveto(0)
+        self._render_flag_rows()
+
+    def _schedule_flag_rows_refresh(self):
+        if self._flags_refresh_id is None:
+            self._flags_refresh_id = self.flags_inner_frame.after_idle(
+                self._render_flag_rows
             )
-            checkbox.pack(anchor="w", padx=8, pady=2)
 
-            self.flag_widgets[flag_id] = (checkbox, var)
+    def _visible_flag_range(self) -> tuple[int, int]:
+        """Return the [first, last) flag rows currently inside the viewport."""
+        if not self._flag_rows:
+            return 0, 0
+        canvas = self.flags_inner_frame._parent_canvas
+        # Rows are placed in unscaled units, canvas coordinates are pixels
+        row_height = self.flags_inner_frame._apply_widget_scaling(self._FLAG_ROW_HEIGHT)
+        top = canvas.canvasy(0)
+        # Before the first layout pass the canvas reports a 1px height
+        height = max(canvas.winfo_height(), row_height)
+        start = int(top // row_height) - self._FLAG_BUFFER_ROWS
+        end = math.ceil((top + height) / row_height) + self._FLAG_BUFFER_ROWS
+        return max(start, 0), min(end, len(self._flag_rows))
+
+    def _render_flag_rows(self):
+        self._flags_refresh_id = None
+        start, end = self._visible_flag_range()
+
+        while len(self._flag_row_pool) < end - start:
+            self._flag_row_pool.append(
+                self._FlagRow(self.flags_inner_frame, self.on_flag_toggled)
+            )
 
-        # Flush pending X11 requests before allocating the next batch
-        self.flags_inner_frame.update_idletasks()
+        # Rows still in view stay where they are; only the freed ones move to
+        # the indices that scrolled in
+        placed = set()
+        free = []
+        for row in self._flag_row_pool:
+            if row.row is not None and start <= row.row < end:
+                placed.add(row.row)
+            else:
+                free.append(row)
 
-        next_offset = offset + self._RENDER_CHUNK
-        if next_offset < total:
-            self.status_label.configure(
-                text=f"Loading {next_offset}/{total} flags in {label}..."
-            )
-            self.flags_inner_frame.after(
-                self._RENDER_DELAY,
-                lambda: self._render_flags_chunk(flags, next_offset, total, label),
+        for index in range(start, end):
+            if index in placed:
+                continue
+            row = free.pop()
+            flag_id, text = self._flag_rows[index]
+            row.flag_id = flag_id
+            row.row = index
+            self._set_row_state(row, self._displayed_flag_state(index))
+            if row.text != text:
+                row.text = text
+                row.checkbox.configure(text=text)
+            row.checkbox.place(x=8, y=index * self._FLAG_ROW_HEIGHT + 2)
+
+        for row in free:
+            if row.row is not None:
+                row.checkbox.place_forget()
+                row.row = None
+
+    @staticmethod
+    def _set_row_state(row, state):
+        # Writing the variable redraws the checkbox even if the value is unchanged
+        if row.var.get() != state:
+            row.var.set(state)
+
+    def _refresh_visible_flag_rows(self):
+        """Re-read the displayed state of the rows currently placed."""
+        for row in self._flag_row_pool:
+            if row.row is not None:
+                self._set_row_state(row, self._displayed_flag_state(row.row))
+
+    def _hydrate_flag_rows(self):
+        """Read the saved state of every listed flag in one pass."""
+        if self._flag_rows and self.current_event_flags is not None:
+            self._flag_row_states = self.current_event_flags.get_flags(
+                [flag_id for flag_id, _text in self._flag_rows]
             )
         else:
-            self.status_label.configure(text=f"Showing {total} flags in {label}")
+            self._flag_row_states = [False] * len(self._flag_rows)
+
+    def _displayed_flag_state(self, index) -> bool:
+        flag_id = self._flag_rows[index][0]
+        return self.flag_states.get(flag_id, self._flag_row_states[index])
 
     def on_flag_toggled(self, flag_id, var):
         """Handle flag checkbox toggle"""
         self.flag_states[flag_id] = var.get()
 
+    _SEARCH_DEBOUNCE_MS = 250
+
+    def _schedule_search(self, *args):
+        """Run the search once typing pauses instead of on every keystroke"""
+        if self._search_after_id is not None:
+            self.parent.after_cancel(self._search_after_id)
+        self._search_after_id = self.parent.after(
+            self._SEARCH_DEBOUNCE_MS, self.on_search_changed
+        )
+
     def on_search_changed(self, *args):
         """Handle search text change"""
+        self._search_after_id = None
         if self.current_event_flags is None:
             return
 
         query = self.search_var.get().strip().lower()
-        if not query:
+        if not query or query == self._last_search_term:
             return
 
-        # Clear current display
-        for widget in self.flags_inner_frame.winfo_children():
-            widget.destroy()
-        self.flag_widgets.clear()
-
-        # Search through all categories
-        results = []
-        for category in CATEGORIES:
-            subcats = get_subcategories(category)
-            if subcats:
-                for subcat in subcats:
-                    flags = get_category_flags(category, subcat)
-                    for flag_id in flags:
-                        flag_name = get_flag_name(flag_id)
-                        if query in str(flag_id).lower() or query in flag_name.lower():
-                            results.append((flag_id, flag_name, category, subcat))
-            else:
-                flags = get_category_flags(category, None)
-                for flag_id in flags:
-                    flag_name = get_flag_name(flag_id)
-                    if query in str(flag_id).lower() or query in flag_name.lower():
-                        results.append((flag_id, flag_name, category, None))
-
-        self.status_label.configure(text="Searching...")
-        self._render_search_chunk(results, 0)
-
-    def _render_search_chunk(self, results, offset):
-        """Render one chunk of search results, then schedule the next batch."""
-        chunk = results[offset : offset + self._RENDER_CHUNK]
-
-        for flag_id, flag_name, category, subcategory in chunk:
-            is_set = self.current_event_flags.get_flag(flag_id)
-
-            if flag_id not in self.flag_states:
-                self.flag_states[flag_id] = is_set
-
-            var = tk.BooleanVar(value=is_set)
+        results = search_flags(query)
 
+        rows = []
+        for flag_id, flag_name, category, subcategory in results:
             location = f"{category} > {subcategory}" if subcategory else category
-
-            checkbox = ctk.CTkCheckBox(
-                self.flags_inner_frame,
-                text=f"{flag_id}: {flag_name} ({location})",
-                variable=var,
-                command=lambda fid=flag_id, v=var: self.on_flag_toggled(fid, v),
-            )
-            checkbox.pack(anchor="w", padx=8, pady=2)
-
-            self.flag_widgets[flag_id] = (checkbox, var)
-
-        self.flags_inner_frame.update_idletasks()
-
-        next_offset = offset + self._RENDER_CHUNK
-        total = len(results)
-        if next_offset < total:
-            self.flags_inner_frame.after(
-                self._RENDER_DELAY,
-                lambda: self._render_search_chunk(results, next_offset),
-            )
-        else:
-            self.status_label.configure(text=f"Found {total} matching flags")
+            rows.append((flag_id, f"{flag_id}: {flag_name} ({location})"))
+        self.show_flag_rows(rows)
+        self._last_search_term = query
+        self.status_label.configure(text=f"Found {len(rows)} matching flags")
 
     def clear_search(self):
         """Clear search field"""
         self.search_var.set("")
-        for widget in self.flags_inner_frame.winfo_children():
-            widget.destroy()
-        self.flag_widgets.clear()
+        self.show_flag_rows([])
         self.status_label.configure(text="Select a category or search for flags")
 
     def unlock_all_in_category(self):
         """Unlock all flags in current category"""
-        if not self.flag_widgets:
+        if not self._flag_rows:
             CTkMessageBox.showwarning(
                 "No Flags", "No flags are currently displayed!", parent=self.parent
             )
@@ -544,20 +606,21 @@ class EventFlagsTab:
 
         result = CTkMessageBox.askyesno(
             "Confirm",
-            f"Set all {len(self.flag_widgets)} displayed flags to ON?\n\n"
+            f"Set all {len(self._flag_rows)} displayed flags to ON?\n\n"
             f"This will affect only the flags currently visible.",
             parent=self.parent,
         )
 
         if result:
-            for flag_id, (checkbox, var) in self.flag_widgets.items():
-                var.set(True)
-                self.flag_states[flag_id] = True
-                checkbox.select()
+            # Only the pending states change; just the placed rows need redrawing
+            self.flag_states.update(
+                dict.fromkeys((flag_id for flag_id, _text in self._flag_rows), True)
+            )
+            self._refresh_visible_flag_rows()
 
             CTkMessageBox.showinfo(
                 "Success",
-                f"Enabled all {len(self.flag_widgets)} displayed flags.\n\nClick 'Apply Changes' to save.",
+                f"Enabled all {len(self._flag_rows)} displayed flags.\n\nClick 'Apply Changes' to save.",
                 parent=self.parent,
             )
 
@@ -575,12 +638,16 @@ class EventFlagsTab:
             )
             return
 
-        # Count changes
-        changes = 0
-        for flag_id, new_state in self.flag_states.items():
-            current_state = self.current_event_flags.get_flag(flag_id)
-            if current_state != new_state:
-                changes += 1
+        # Only flags whose state differs need writing
+        current = self.current_event_flags.get_flags(self.flag_states)
+        pending = [
+            (flag_id, new_state)
+            for (flag_id, new_state), state in zip(
+                self.flag_states.items(), current, strict=True
+            )
+            if state != new_state
+        ]
+        changes = len(pending)
 
         if changes == 0:
             CTkMessageBox.showinfo(
@@ -604,7 +671,7 @@ class EventFlagsTab:
         # Create backup
         save_path = self.get_save_path()
         if save_path:
-            backup_mgr = BackupManager(save_path)
+            backup_mgr = self._get_backup_manager(save_path)
             backup_mgr.create_backup(
                 description=f"Before event flag changes (Slot {self.current_slot + 1})",
                 operation="event_flag_changes",
@@ -612,14 +679,37 @@ class EventFlagsTab:
             )
 
         # Apply changes
-        for flag_id, new_state in self.flag_states.items():
-            self.current_event_flags.set_flag(flag_id, new_state)
+        self.current_event_flags.set_flags(pending)
 
         # CRITICAL: Write the modified event_flags buffer back to _raw_data
         # The set_flag() updates slot.event_flags in memory, but we must also
         # update the save file's raw data buffer that gets written to disk
+        self._write_event_flags(save_file, self.get_save_path())
+        self.reload_save()
+        self.show_toast(
+            f"Applied {changes} flag changes to Slot {self.current_slot + 1}!",
+            duration=2500,
+        )
+
+        # Clear states
+        self.flag_states.clear()
+
+    def _get_backup_manager(self, save_path):
+        """Return the tab's BackupManager, recreated when the save path changes."""
+        path = Path(save_path).resolve()
+        if self._backup_manager is None or self._backup_manager.save_path != path:
+            self._backup_manager = BackupManager(path)
+        return self._backup_manager
+
+    def _write_event_flags(self, save_file, save_path):
+        """Copy the slot's edited event flags into the save and write it to disk.
+
+        Only the event flags and this slot's checksum are rewritten when the slot
+        on disk still matches the loaded save; otherwise the whole save is written.
+        """
         slot = save_file.character_slots[self.current_slot]
 
+        written = False
         if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
             # Calculate absolute offset in the raw data
             absolute_offset = slot.event_flags_offset
@@ -630,19 +720,22 @@ class EventFlagsTab:
                 absolute_offset : absolute_offset + event_flags_size
             ] = slot.event_flags
 
-        # Recalculate checksums before saving
-        save_file.recalculate_checksums()
+            checksum_region = save_file.recalculate_slot_checksum(self.current_slot)
+            regions = [(absolute_offset, event_flags_size), checksum_region]
+            # The checksum covers the whole slot, so the rest of it must be
+            # unchanged on disk (e.g. not saved by the game since loading)
+            written = bool(save_path) and save_file.write_regions(
+                save_path, regions, verify=[save_file.slot_region(self.current_slot)]
+            )
 
-        # Save
-        save_file.save(self.get_save_path())
-        self.reload_save()
-        self.show_toast(
-            f"Applied {changes} flag changes to Slot {self.current_slot + 1}!",
-            duration=2500,
-        )
+        if not written:
+            # Recalculate checksums before saving
+            save_file.recalculate_checksums()
+            save_file.save(save_path)
 
-        # Clear states
-        self.flag_states.clear()
+        # Saved states changed; re-read them for the listed flags
+        self._hydrate_flag_rows()
+        self._refresh_visible_flag_rows()
 
     def export_flags(self):
         """Export all set event flags to a JSON file."""
@@ -796,7 +889,7 @@ class EventFlagsTab:
         save_file = self.get_save_file()
 
         try:
-            backup_mgr = BackupManager(save_path)
+            backup_mgr = self._get_backup_manager(save_path)
             backup_mgr.create_backup(
                 description=f"Before flag import (Slot {self.current_slot + 1})",
                 operation="flag_import",
@@ -817,24 +910,13 @@ class EventFlagsTab:
             except Exception:
                 pass
 
-        slot = save_file.character_slots[self.current_slot]
-        if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-            absolute_offset = slot.event_flags_offset
-            event_flags_size = 0x1BF99F
-            save_file._raw_data[
-                absolute_offset : absolute_offset + event_flags_size
-            ] = slot.event_flags
-
-        save_file.recalculate_checksums()
-        save_file.save(self.get_save_path())
+        self._write_event_flags(save_file, self.get_save_path())
         self.reload_save()
 
         # Refresh displayed checkboxes to reflect imported state
-        if self.flag_widgets:
-            for flag_id, (_cb, var) in self.flag_widgets.items():
-                current = self.current_event_flags.get_flag(flag_id)
-                var.set(current)
-                self.flag_states[flag_id] = current
+        for flag_id, _text in self._flag_rows:
+            self.flag_states.pop(flag_id, None)
+        self._refresh_visible_flag_rows()
 
         self.show_toast(f"Imported {applied} flags", duration=2500)
 
@@ -904,7 +986,7 @@ class EventFlagsTab:
                     return
 
                 try:
-                    backup_mgr = BackupManager(save_path)
+                    backup_mgr = self._get_backup_manager(save_path)
                     backup_mgr.create_backup(
                         description=f"Before advanced flag toggle {flag_id} (Slot {self.current_slot + 1})",
                         operation="advanced_flag_toggle",
@@ -921,16 +1003,7 @@ class EventFlagsTab:
                 new_state = not current
                 self.current_event_flags.set_flag(flag_id, new_state)
 
-                slot = save_file.character_slots[self.current_slot]
-                if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-                    absolute_offset = slot.event_flags_offset
-                    event_flags_size = 0x1BF99F
-                    save_file._raw_data[
-                        absolute_offset : absolute_offset + event_flags_size
-                    ] = slot.event_flags
-
-                save_file.recalculate_checksums()
-                save_file.save(save_path)
+                self._write_event_flags(save_file, save_path)
                 self.reload_save()
 
                 self.show_toast(
@@ -1015,6 +1088,7 @@ class EventFlagsTab:
         from er_save_manager.ui.utils import force_render_dialog
 
         dialog = ctk.CTkToplevel(self.parent)
+        bindings_before = global_bindings(dialog)
         dialog.title("Boss Respawn")
         width, height = 700, 600
         dialog.transient(self.parent)
@@ -1064,13 +1138,18 @@ class EventFlagsTab:
         boss_frame = ctk.CTkScrollableFrame(dialog, corner_radius=10)
         boss_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 10))
         bind_mousewheel(boss_frame)
+        unbind_global_bindings_on_destroy(dialog, bindings_before)
 
         boss_vars = {}
+        boss_list = None
 
         def populate_bosses(*_args):
-            # Clear current bosses
-            for widget in boss_frame.winfo_children():
-                widget.destroy()
+            nonlocal boss_list
+            # Clear current bosses with a single destroy of their container
+            if boss_list is not None:
+                boss_list.destroy()
+            boss_list = ctk.CTkFrame(boss_frame, fg_color="transparent")
+            boss_list.pack(fill=tk.X)
             boss_vars.clear()
 
             category = boss_category_var.get()
@@ -1088,7 +1167,7 @@ class EventFlagsTab:
                 boss_vars[boss_name] = (flags, var)
 
                 item_frame = ctk.CTkFrame(
-                    boss_frame,
+                    boss_list,
                     corner_radius=6,
                     fg_color=("#ffffff", "#1f1f28"),
                 )
@@ -1143,7 +1222,7 @@ class EventFlagsTab:
 
             if save_path and save_path.is_file():
                 try:
-                    backup_mgr = BackupManager(save_path)
+                    backup_mgr = self._get_backup_manager(save_path)
                     backup_mgr.create_backup(
                         description=f"Before boss respawn (Slot {self.current_slot + 1})",
                         operation="respawn_boss",
@@ -1163,17 +1242,7 @@ class EventFlagsTab:
                 )
 
             # Write to raw data and recalculate checksums
-            slot = save_file.character_slots[self.current_slot]
-
-            if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-                absolute_offset = slot.event_flags_offset
-                event_flags_size = 0x1BF99F
-                save_file._raw_data[
-                    absolute_offset : absolute_offset + event_flags_size
-                ] = slot.event_flags
-
-            save_file.recalculate_checksums()
-            save_file.save(self.get_save_path())
+            self._write_event_flags(save_file, self.get_save_path())
             self.reload_save()
 
             # Teleport to Roundtable Hold
@@ -1230,7 +1299,7 @@ class EventFlagsTab:
             save_path = self.get_save_path()
             if save_path and save_path.is_file():
                 try:
-                    backup_mgr = BackupManager(save_path)
+                    backup_mgr = self._get_backup_manager(save_path)
                     backup_mgr.create_backup(
                         description=f"Before respawn all ({boss_category_var.get()}, Slot {self.current_slot + 1})",
                         operation="respawn_all_bosses",
@@ -1252,17 +1321,7 @@ class EventFlagsTab:
                 )
 
             # Write to raw data and recalculate checksums
-            slot = save_file.character_slots[self.current_slot]
-
-            if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-                absolute_offset = slot.event_flags_offset
-                event_flags_size = 0x1BF99F
-                save_file._raw_data[
-                    absolute_offset : absolute_offset + event_flags_size
-                ] = slot.event_flags
-
-            save_file.recalculate_checksums()
-            save_file.save(self.get_save_path())
+            self._write_event_flags(save_file, self.get_save_path())
             self.reload_save()
 
             # Teleport to Roundtable Hold
@@ -1312,6 +1371,7 @@ class EventFlagsTab:
         from er_save_manager.ui.utils import force_render_dialog
 
         dialog = ctk.CTkToplevel(self.parent)
+        bindings_before = global_bindings(dialog)
         dialog.title("NPC Revival")
         width, height = 700, 600
         dialog.transient(self.parent)
@@ -1346,6 +1406,7 @@ class EventFlagsTab:
         npc_frame = ctk.CTkScrollableFrame(dialog, corner_radius=10)
         npc_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 10))
         bind_mousewheel(npc_frame)
+        unbind_global_bindings_on_destroy(dialog, bindings_before)
 
         npc_vars = {}
 
@@ -1409,7 +1470,7 @@ class EventFlagsTab:
             save_file = self.get_save_file()
             if save_path:
                 try:
-                    backup_mgr = BackupManager(save_path)
+                    backup_mgr = self._get_backup_manager(save_path)
                     backup_mgr.create_backup(
                         description=f"Before NPC revival (Slot {self.current_slot + 1})",
                         operation="npc_revival",
@@ -1423,16 +1484,7 @@ class EventFlagsTab:
                     )
 
             # Write to raw data and save
-            slot = save_file.character_slots[self.current_slot]
-            if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-                absolute_offset = slot.event_flags_offset
-                event_flags_size = 0x1BF99F
-                save_file._raw_data[
-                    absolute_offset : absolute_offset + event_flags_size
-                ] = slot.event_flags
-
-            save_file.recalculate_checksums()
-            save_file.save(self.get_save_path())
+            self._write_event_flags(save_file, self.get_save_path())
             self.reload_save()
 
             self.show_toast(f"Revived {count} NPC(s)!", duration=2500)
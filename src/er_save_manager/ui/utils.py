@@ -2,6 +2,7 @@
 
 import os
 import platform as platform_module
+import re
 import shutil
 import subprocess
 import webbrowser
@@ -91,6 +92,69 @@ def bind_mousewheel(widget, target_widget=None):
         target_widget.bind("<Map>", on_map, add="+")
 
 
+def global_bindings(widget) -> set[tuple[str, str]]:
+    """
+    Snapshot the handlers bound to the 'all' tag as (sequence, script line).
+
+    Take one before building a dialog and pass it to
+    unbind_global_bindings_on_destroy once the dialog's widgets exist.
+    """
+    tk = widget.tk
+    bindings = set()
+    for sequence in tk.splitlist(tk.call("bind", "all")):
+        for line in tk.call("bind", "all", sequence).splitlines():
+            if line.strip():
+                bindings.add((sequence, line))
+    return bindings
+
+
+def _unbind_global_bindings(root, bindings):
+    """Strip bindings from the 'all' tag and free the Tcl commands they call."""
+    tk = root.tk
+    for sequence in {sequence for sequence, _ in bindings}:
+        script = tk.call("bind", "all", sequence)
+        kept = [
+            line for line in script.splitlines() if (sequence, line) not in bindings
+        ]
+        tk.call("bind", "all", sequence, "\n".join(kept))
+    for _, line in bindings:
+        # Lines look like: if {"[<command> %# %b ...]" == "break"} break
+        match = re.search(r"\[(\S+)", line)
+        if match:
+            try:
+                root.deletecommand(match.group(1))
+            except Exception:
+                pass
+
+
+def unbind_global_bindings_on_destroy(dialog, before):
+    """
+    Remove the 'all' handlers added since the before snapshot when dialog is destroyed.
+
+    CTkScrollableFrame installs mousewheel and Shift handlers with bind_all but
+    never removes them, so each closed dialog would leave stale handlers that
+    run on every wheel tick app-wide and keep the frames alive.
+    """
+    try:
+        added = global_bindings(dialog) - before
+    except Exception:
+        return
+    if not added:
+        return
+    root = dialog._root()
+    path = str(dialog)
+
+    def on_destroy(event):
+        # <Destroy> bound on a toplevel also fires for each of its children
+        if str(event.widget) == path:
+            try:
+                _unbind_global_bindings(root, added)
+            except Exception:
+                pass
+
+    dialog.bind("<Destroy>", on_destroy, add="+")
+
+
 def open_url(url: str) -> bool:
     """Open a URL in the user's default browser with cross-platform fallbacks."""
     platform_name = platform_module.system()
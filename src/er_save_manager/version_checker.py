@@ -1,6 +1,11 @@
 """Version checking and update notification."""
 
+import json
+import threading
+import time
+import urllib.error
 import urllib.request
+from pathlib import Path
 
 from packaging.version import Version
 
@@ -13,14 +18,77 @@ class VersionChecker:
     )
     GITHUB_RELEASES_URL = "https://github.com/Hapfel1/er-save-manager/releases"
 
-    def __init__(self, current_version: str):
+    # How long a cached release lookup is trusted before asking GitHub again
+    CACHE_TTL = 6 * 60 * 60
+
+    def __init__(self, current_version: str, cache_file: Path | None = None):
         """
         Initialize version checker.
 
         Args:
             current_version: Current application version (e.g., "0.7.4")
+            cache_file: Optional JSON file caching the last release lookup
         """
         self.current_version = current_version
+        self.cache_file = cache_file
+
+    def _load_cache(self) -> dict:
+        if self.cache_file is None:
+            return {}
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) and "tag_name" in data else {}
+
+    def _save_cache(self, data: dict) -> None:
+        if self.cache_file is None:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        except OSError:
+            pass
+
+    def _fetch_latest_release(self) -> dict:
+        """
+        Get the latest release's tag_name and html_url.
+
+        Served from the cache within CACHE_TTL; after that the request is
+        revalidated with the cached ETag, so an unchanged release costs a
+        bodyless 304 that doesn't count against GitHub's rate limit.
+        """
+        cache = self._load_cache()
+        now = time.time()
+        if cache and now - cache.get("last_checked", 0) < self.CACHE_TTL:
+            return cache
+
+        headers = {"Accept": "application/vnd.github.v3+json"}
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        req = urllib.request.Request(self.GITHUB_API_URL, headers=headers)
+
+        try:
+            with urllib.request.urlopen(req, timeout=5) as response:
+                data = json.load(response)
+                etag = response.headers.get("ETag")
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cache:
+                cache["last_checked"] = now
+                self._save_cache(cache)
+                return cache
+            raise
+
+        release = {
+            "tag_name": data.get("tag_name", ""),
+            "html_url": data.get("html_url", self.GITHUB_RELEASES_URL),
+            "etag": etag,
+            "last_checked": now,
+        }
+        self._save_cache(release)
+        return release
 
     def check_for_updates(self) -> tuple[bool, str | None, str | None]:
         """
@@ -33,16 +101,8 @@ class VersionChecker:
             - download_url: URL to the releases page
         """
         try:
-            # Fetch latest release info from GitHub API
-            req = urllib.request.Request(
-                self.GITHUB_API_URL,
-                headers={"Accept": "application/vnd.github.v3+json"},
-            )
-
-            with urllib.request.urlopen(req, timeout=5) as response:
-                import json
-
-                data = json.loads(response.read().decode("utf-8"))
+            # Fetch latest release info from GitHub API (or the cache)
+            data = self._fetch_latest_release()
 
             # Extract version from tag_name (e.g., "v0.8.0" -> "0.8.0")
             tag_name = data.get("tag_name", "")
@@ -72,3 +132,18 @@ class VersionChecker:
         except Exception:
             # Network error or API failure - silently fail
             return False, None, None
+
+    def check_async(self, callback) -> threading.Thread:
+        """
+        Run check_for_updates on a daemon thread.
+
+        Args:
+            callback: Called with the check_for_updates() result on the worker
+                thread; UI callers should hand it to their main loop (e.g. via
+                root.after)
+        """
+        thread = threading.Thread(
+            target=lambda: callback(self.check_for_updates()), daemon=True
+        )
+        thread.start()
+        return thread
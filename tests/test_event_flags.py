@@ -0,0 +1,65 @@
+"""Tests for bulk event flag reads and writes."""
+
+import random
+
+import pytest
+
+from er_save_manager.parser.event_flags import EventFlags
+
+# Two BST blocks of 125 bytes each: block 10 first, block 20 second
+FLAGS_SIZE = 2 * EventFlags.BLOCK_SIZE
+FLAG_IDS = [10000, 10007, 10008, 10999, 20000, 20500, 20999]
+
+
+@pytest.fixture(autouse=True)
+def small_flag_layout(monkeypatch):
+    """Use a tiny synthetic BST instead of the real 1.8 MB flag layout."""
+    monkeypatch.setattr(EventFlags, "_bst_map", {10: 0, 20: 1})
+    monkeypatch.setattr(EventFlags, "EVENT_FLAGS_SIZE", FLAGS_SIZE)
+
+
+def test_set_flags_bulk_matches_set_flag():
+    """Test that a bulk write equals the same writes made one at a time."""
+    rng = random.Random(0)
+    changes = [(flag_id, rng.random() < 0.5) for flag_id in FLAG_IDS * 3]
+    start = bytes(rng.randbytes(FLAGS_SIZE))
+
+    single = bytearray(start)
+    for flag_id, state in changes:
+        EventFlags.set_flag(single, flag_id, state)
+
+    bulk = bytearray(start)
+    EventFlags.set_flags_bulk(bulk, changes)
+
+    assert bulk == single
+    assert EventFlags.get_flags_bulk(bulk, FLAG_IDS) == [
+        EventFlags.get_flag(single, flag_id) for flag_id in FLAG_IDS
+    ]
+
+
+def test_set_flags_bulk_counts_changes():
+    """Test that only flags whose state changes are counted."""
+    flags = bytearray(FLAGS_SIZE)
+
+    assert EventFlags.set_flags_bulk(flags, [(10000, True), (20500, True)]) == 2
+    assert EventFlags.get_flags_bulk(flags, [10000, 10001, 20500]) == [
+        True,
+        False,
+        True,
+    ]
+
+    before = bytes(flags)
+    assert EventFlags.set_flags_bulk(flags, [(10000, True), (10001, False)]) == 0
+    assert flags == before
+
+
+def test_set_flags_bulk_rejects_unknown_id():
+    """Test that an unknown flag ID raises before anything is written."""
+    flags = bytearray(FLAGS_SIZE)
+
+    with pytest.raises(ValueError):
+        EventFlags.set_flags_bulk(flags, [(10000, True), (30000, True)])
+    assert flags == bytearray(FLAGS_SIZE)
+
+    with pytest.raises(ValueError):
+        EventFlags.get_flags_bulk(flags, [30000])
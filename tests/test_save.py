@@ -0,0 +1,63 @@
+"""Tests for partial save writes."""
+
+import random
+
+import pytest
+
+SLOT_OFFSET = 0x310
+FLAGS_OFFSET = SLOT_OFFSET + 0x10 + 0x1000
+FLAGS_SIZE = 0x200
+
+
+@pytest.fixture
+def save():
+    """Save with a single synthetic slot, not parsed from a real file."""
+    from er_save_manager.parser import Save
+
+    save = Save()
+    rng = random.Random(0)
+    save._raw_data = bytearray(rng.randbytes(SLOT_OFFSET + 0x280010 + 0x100))
+    save._slot_offsets = [SLOT_OFFSET]
+    save.recalculate_slot_checksum(0)
+    return save
+
+
+def _edit_flags(save):
+    save._raw_data[FLAGS_OFFSET : FLAGS_OFFSET + FLAGS_SIZE] = b"\xaa" * FLAGS_SIZE
+    checksum_region = save.recalculate_slot_checksum(0)
+    return [(FLAGS_OFFSET, FLAGS_SIZE), checksum_region]
+
+
+def test_write_regions_matches_full_rewrite(save, tmp_path):
+    """Test that patching a file in place equals writing the whole save."""
+    patched = tmp_path / "patched.sl2"
+    full = tmp_path / "full.sl2"
+    save.to_file(patched)
+
+    regions = _edit_flags(save)
+    assert save.write_regions(patched, regions, verify=[save.slot_region(0)])
+    save.to_file(full)
+
+    assert patched.read_bytes() == full.read_bytes()
+
+
+def test_write_regions_rejects_changed_slot(save, tmp_path):
+    """Test that a slot changed on disk since loading is not patched."""
+    path = tmp_path / "save.sl2"
+    save.to_file(path)
+    on_disk = bytearray(path.read_bytes())
+    on_disk[SLOT_OFFSET + 0x20] ^= 0xFF
+    path.write_bytes(on_disk)
+
+    regions = _edit_flags(save)
+    assert not save.write_regions(path, regions, verify=[save.slot_region(0)])
+    assert path.read_bytes() == on_disk
+
+
+def test_write_regions_rejects_size_mismatch(save, tmp_path):
+    """Test that a file of another size is left untouched."""
+    path = tmp_path / "save.sl2"
+    path.write_bytes(b"\x00" * 16)
+
+    assert not save.write_regions(path, _edit_flags(save))
+    assert path.read_bytes() == b"\x00" * 16
@@ -0,0 +1,58 @@
+"""Tests for er_save_manager.ui.utils."""
+
+import tkinter
+
+import pytest
+
+ctk = pytest.importorskip("customtkinter")
+
+
+@pytest.fixture
+def root():
+    """Hidden CTk root window, skipped when no display is available."""
+    try:
+        root = ctk.CTk()
+    except tkinter.TclError:
+        pytest.skip("no display available")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+def _open_scrollable_dialog(root):
+    from er_save_manager.ui.utils import (
+        global_bindings,
+        unbind_global_bindings_on_destroy,
+    )
+
+    dialog = ctk.CTkToplevel(root)
+    before = global_bindings(dialog)
+    ctk.CTkScrollableFrame(dialog).pack()
+    ctk.CTkScrollableFrame(dialog).pack()
+    unbind_global_bindings_on_destroy(dialog, before)
+    return dialog
+
+
+def test_closed_dialog_leaves_no_global_bindings(root):
+    """Test that a dialog's scrollable frames drop their 'all' handlers."""
+    from er_save_manager.ui.utils import global_bindings
+
+    baseline = global_bindings(root)
+
+    dialog = _open_scrollable_dialog(root)
+    assert len(global_bindings(root)) > len(baseline)
+
+    dialog.destroy()
+    root.update()
+    assert global_bindings(root) == baseline
+
+
+def test_global_bindings_stay_flat_across_dialogs(root):
+    """Test that reopening dialogs does not accumulate 'all' handlers."""
+    from er_save_manager.ui.utils import global_bindings
+
+    baseline = global_bindings(root)
+    for _ in range(5):
+        _open_scrollable_dialog(root).destroy()
+        root.update()
+        assert global_bindings(root) == baseline
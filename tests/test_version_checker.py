@@ -0,0 +1,92 @@
+"""Tests for the cached GitHub release lookup."""
+
+import io
+import json
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from er_save_manager.version_checker import VersionChecker
+
+RELEASE = {
+    "tag_name": "v9.9.9",
+    "html_url": "https://github.com/Hapfel1/er-save-manager/releases/tag/v9.9.9",
+}
+
+
+class _Response(io.BytesIO):
+    def __init__(self, data: dict, etag: str):
+        super().__init__(json.dumps(data).encode())
+        self.headers = {"ETag": etag}
+
+
+@pytest.fixture
+def requests(monkeypatch):
+    """Record urlopen requests and answer them with the queued responses."""
+    sent = []
+    replies = []
+
+    def fake_urlopen(req, timeout=None):
+        sent.append(req)
+        reply = replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    return sent, replies
+
+
+def _write_cache(path, age: float, **extra):
+    data = {**RELEASE, "etag": '"abc"', "last_checked": time.time() - age, **extra}
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_fresh_cache_skips_network(tmp_path, requests):
+    """Test that a cache younger than CACHE_TTL is used as is."""
+    sent, _ = requests
+    cache_file = tmp_path / "update_check.json"
+    _write_cache(cache_file, age=60)
+
+    checker = VersionChecker("1.0.0", cache_file=cache_file)
+    assert checker.check_for_updates() == (True, "9.9.9", RELEASE["html_url"])
+    assert sent == []
+
+
+def test_stale_cache_revalidates_with_etag(tmp_path, requests):
+    """Test that an expired cache sends If-None-Match and stores the reply."""
+    sent, replies = requests
+    cache_file = tmp_path / "update_check.json"
+    _write_cache(cache_file, age=VersionChecker.CACHE_TTL + 60)
+    newer = {"tag_name": "v10.0.0", "html_url": RELEASE["html_url"]}
+    replies.append(_Response(newer, etag='"def"'))
+
+    checker = VersionChecker("1.0.0", cache_file=cache_file)
+    assert checker.check_for_updates()[1] == "10.0.0"
+
+    assert sent[0].get_header("If-none-match") == '"abc"'
+    cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert cached["tag_name"] == "v10.0.0"
+    assert cached["etag"] == '"def"'
+
+
+def test_not_modified_reuses_cached_release(tmp_path, requests):
+    """Test that a 304 reply keeps the cached release and restarts the TTL."""
+    sent, replies = requests
+    cache_file = tmp_path / "update_check.json"
+    _write_cache(cache_file, age=VersionChecker.CACHE_TTL + 60)
+    replies.append(
+        urllib.error.HTTPError(
+            VersionChecker.GITHUB_API_URL, 304, "Not Modified", {}, None
+        )
+    )
+
+    checker = VersionChecker("1.0.0", cache_file=cache_file)
+    assert checker.check_for_updates() == (True, "9.9.9", RELEASE["html_url"])
+    assert len(sent) == 1
+
+    # The refreshed timestamp means the next check stays off the network
+    assert checker.check_for_updates()[1] == "9.9.9"
+    assert len(sent) == 1